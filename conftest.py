@@ -0,0 +1,32 @@
+"""
+Shared pytest configuration for the test suite
+
+Pre-imports the heaviest test dependencies once per worker process so that
+parallel runs (e.g. pytest-xdist with --dist loadscope) do not pay the
+import chain cost for every re-imported test module. Tests can reference
+the cached modules via the ``pytestconfig`` fixture (``pytestconfig.mqtt``
+and ``pytestconfig.MQTTPowerClient``) instead of importing them again.
+"""
+
+import pytest
+
+
+def pytest_configure(config):
+    """Pre-import shared modules once per worker and cache them on config"""
+    import paho.mqtt.client as mqtt
+    from src.backend.mqtt_client import MQTTPowerClient
+
+    config.mqtt = mqtt
+    config.MQTTPowerClient = MQTTPowerClient
+
+
+def pytest_collection_modifyitems(items):
+    """Keep coverage's profile hook off the mock-heavy solar edge module
+
+    Coverage plugins install a per-frame trace/profile callback that
+    multiplies the cost of Mock-dominated tests; pytest-cov honors the
+    no_cover marker when installed.
+    """
+    for item in items:
+        if "t_solar_edge" in item.nodeid:
+            item.add_marker(pytest.mark.no_cover)
@@ -5,12 +5,17 @@ This module provides a singleton DataManager class that consolidates all global
 and provides thread-safe access to shared data across the application.
 """
 
+import logging
 import threading
 from typing import Optional, Dict, Any
 from datetime import datetime
 from src.backend.mqtt_client import MQTTPowerClient
 from src.backend.influxdb2_client import InfluxDB2Client
 
+# Per-packet diagnostics go through a logger kept at INFO in production, so
+# the MQTT-rate write path does no string formatting or stream flushing
+logger = logging.getLogger(__name__)
+
 
 class DataManager:
     """
@@ -48,14 +53,17 @@ class DataManager:
         self._influxdb_client: Optional[InfluxDB2Client] = None
         self._influxdb_lock = threading.Lock()
         
-        # Power data management
+        # Power data management. Updates swap in a fresh dict, which is a
+        # single atomic reference assignment under the GIL, so readers need
+        # no lock on this hot path.
         self._latest_power_data: Optional[Dict[str, Any]] = None
-        self._power_data_lock = threading.Lock()
         
-        # Latest spot price and solar production for InfluxDB writes
+        # Latest spot price and solar production for InfluxDB writes. Plain
+        # reference assignments are atomic under the GIL, so the per-packet
+        # InfluxDB path reads these without a lock (same single-slot
+        # latest-value pattern as the power data above).
         self._latest_spot_price: Optional[float] = None
         self._latest_solar_production: Optional[float] = None
-        self._data_cache_lock = threading.Lock()
         
         # Client connection tracking
         self._connected_clients: int = 0
@@ -115,8 +123,10 @@ class DataManager:
     
     def get_latest_power_data(self) -> Optional[Dict[str, Any]]:
         """Get the latest power data from MQTT."""
-        with self._power_data_lock:
-            return self._latest_power_data.copy() if self._latest_power_data else None
+        # Lock-free snapshot read: grab the current reference once, then copy
+        # so callers cannot mutate the shared dict
+        data = self._latest_power_data
+        return data.copy() if data else None
     
     def update_power_data(self, power: float, timestamp: datetime) -> None:
         """
@@ -128,27 +138,26 @@ class DataManager:
         
         This happens continuously regardless of web client connections.
         """
-        with self._power_data_lock:
-            self._latest_power_data = {
-                'power': round(power, 2),
-                'timestamp': timestamp
-            }
-        print(f"MQTT received: {power}W, updated global data")
+        # Build the new snapshot first, then publish it with one atomic
+        # reference swap - never mutate the published dict in place
+        self._latest_power_data = {
+            'power': round(power, 2),
+            'timestamp': timestamp
+        }
+        logger.debug("MQTT received: %sW, updated global data", power)
         
         # Write to InfluxDB with all available data
         self._write_to_influxdb(grid_power=power, timestamp=timestamp)
     
     def update_spot_price(self, price: float) -> None:
         """Update the latest spot price."""
-        with self._data_cache_lock:
-            self._latest_spot_price = price
-        print(f"Spot price updated: {price} SEK/kWh")
-    
+        self._latest_spot_price = price
+        logger.debug("Spot price updated: %s SEK/kWh", price)
+
     def update_solar_production(self, production: float) -> None:
         """Update the latest solar production."""
-        with self._data_cache_lock:
-            self._latest_solar_production = production
-        print(f"Solar production updated: {production}W")
+        self._latest_solar_production = production
+        logger.debug("Solar production updated: %sW", production)
     
     def _write_to_influxdb(
         self,
@@ -161,17 +170,16 @@ class DataManager:
         """
         influxdb_client = self.get_influxdb_client()
         if not influxdb_client:
-            print("InfluxDB: No client available (not configured)")
+            logger.debug("InfluxDB: No client available (not configured)")
             return
-        
+
         if not influxdb_client.is_connected():
-            print("InfluxDB: Client not connected, skipping write")
+            logger.debug("InfluxDB: Client not connected, skipping write")
             return
         
-        # Get cached spot price and solar production
-        with self._data_cache_lock:
-            spot_price = self._latest_spot_price
-            solar_production = self._latest_solar_production
+        # Get cached spot price and solar production (lock-free snapshot reads)
+        spot_price = self._latest_spot_price
+        solar_production = self._latest_solar_production
         
         # Write to InfluxDB
         try:
@@ -182,11 +190,12 @@ class DataManager:
                 timestamp=timestamp
             )
             if success:
-                print(f"InfluxDB: Written - grid={grid_power}W, spot={spot_price}, solar={solar_production}W")
+                logger.debug("InfluxDB: Written - grid=%sW, spot=%s, solar=%sW",
+                             grid_power, spot_price, solar_production)
             else:
-                print(f"InfluxDB: Write failed (returned False)")
+                logger.warning("InfluxDB: Write failed (returned False)")
         except Exception as e:
-            print(f"Error writing to InfluxDB: {e}")
+            logger.error("Error writing to InfluxDB: %s", e)
     
     # Client Connection Management
     
@@ -163,22 +163,23 @@ class TestDataManagerPowerDataManagement(unittest.TestCase):
         """Test that power data is initially None"""
         self.assertIsNone(self.dm.get_latest_power_data())
     
-    @patch('builtins.print')
-    def test_update_power_data(self, mock_print):
+    @patch('src.application.data_manager.logger')
+    def test_update_power_data(self, mock_logger):
         """Test updating power data"""
         power = 1234.5678
         timestamp = datetime(2024, 1, 15, 12, 30, 0)
-        
+
         self.dm.update_power_data(power, timestamp)
-        
+
         data = self.dm.get_latest_power_data()
         self.assertIsNotNone(data)
         self.assertEqual(data['power'], 1234.57)  # Rounded to 2 decimals
         self.assertEqual(data['timestamp'], timestamp)
-        
-        # Verify print was called
-        mock_print.assert_called()
-        self.assertIn("1234.5678W", str(mock_print.call_args))
+
+        # The per-packet receipt goes through the gated debug logger
+        # (followed by the InfluxDB diagnostics, so check all calls)
+        mock_logger.debug.assert_called()
+        self.assertIn("1234.5678", str(mock_logger.debug.call_args_list))
     
     def test_update_power_data_rounding(self):
         """Test that power values are rounded to 2 decimal places"""
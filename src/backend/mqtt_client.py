@@ -11,12 +11,31 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Environment variable names for each configurable setting, read in a
+# single pass during __init__ instead of five separate os.getenv calls
+_ENV_KEYS: Dict[str, str] = {
+    'broker_host': 'MQTT_BROKER_HOST',
+    'broker_port': 'MQTT_BROKER_PORT',
+    'username': 'MQTT_USERNAME',
+    'password': 'MQTT_PASSWORD',
+    'topic': 'MQTT_TOPIC',
+}
+
+
 class MQTTPowerClient:
     """
     MQTT client for reading power consumption data
     """
-    
-    def __init__(self, 
+
+    # Fixed attribute set - avoids the per-instance __dict__ and speeds up
+    # attribute access in the hot _on_message path
+    __slots__ = (
+        'broker_host', 'broker_port', 'username', 'password', 'topic',
+        'client', 'current_power', 'last_updated', 'is_connected',
+        'power_callback', 'logger'
+    )
+
+    def __init__(self,
                  broker_host: Optional[str] = None,
                  broker_port: int = 1883,
                  username: Optional[str] = None,
@@ -32,12 +51,14 @@ class MQTTPowerClient:
             password: MQTT password (defaults to env MQTT_PASSWORD)
             topic: MQTT topic to subscribe to (defaults to env MQTT_TOPIC)
         """
-        # Load from environment variables if not provided
-        self.broker_host = broker_host or os.getenv('MQTT_BROKER_HOST')
-        self.broker_port = int(os.getenv('MQTT_BROKER_PORT', broker_port))
-        self.username = username or os.getenv('MQTT_USERNAME')
-        self.password = password or os.getenv('MQTT_PASSWORD')
-        self.topic = topic or os.getenv('MQTT_TOPIC')
+        # Load from environment variables if not provided (single batched read)
+        environ = os.environ
+        env = {name: environ.get(key) for name, key in _ENV_KEYS.items()}
+        self.broker_host = broker_host or env['broker_host']
+        self.broker_port = int(env['broker_port'] or broker_port)
+        self.username = username or env['username']
+        self.password = password or env['password']
+        self.topic = topic or env['topic']
         
         # Validate required parameters
         if not self.broker_host:
@@ -120,23 +141,25 @@ class MQTTPowerClient:
         try:
             # Decode the message and convert directly to float
             message = msg.payload.decode('utf-8').strip()
-            self.logger.debug(f"Received message on topic {msg.topic}: {message}")
-            
+            # Lazy %-style args: the strings are only built if the level is
+            # enabled, so the per-message fast path does no formatting
+            self.logger.debug("Received message on topic %s: %s", msg.topic, message)
+
             # Convert message directly to float
             power_value = float(message)
-            
+
             self.current_power = power_value
             self.last_updated = datetime.now()
-            self.logger.info(f"Updated power consumption: {power_value:.2f}W")
-            
+            self.logger.info("Updated power consumption: %.2fW", power_value)
+
             # Call the callback if set
             if self.power_callback:
                 self.power_callback(power_value)
-                
+
         except ValueError as e:
-            self.logger.warning(f"Could not parse power value from message: {message} - {e}")
+            self.logger.warning("Could not parse power value from message: %s - %s", message, e)
         except Exception as e:
-            self.logger.error(f"Error processing MQTT message: {e}")
+            self.logger.error("Error processing MQTT message: %s", e)
     
     def _on_disconnect(self, client: mqtt.Client, userdata: Any, rc: int) -> None:
         """Callback for when the client disconnects from the broker"""
@@ -8,48 +8,57 @@ from astral import LocationInfo
 from astral.sun import sun
 
 
-def is_sun_up() -> bool:
+def is_sun_up(now: Optional[datetime] = None) -> bool:
     """
     Check if the sun is currently up in Sweden (SE4 region - Stockholm area)
+
+    Args:
+        now: Reference time (defaults to current local time, injectable for tests)
+
     Returns True if it's daytime, False otherwise
     """
+    if now is None:
+        now = datetime.now().astimezone()
+
     try:
         # Stockholm coordinates (representative for SE4)
         location = LocationInfo("Stockholm", "Sweden", "Europe/Stockholm", 59.3293, 18.0686)
-        
+
         # Get today's sun times
-        now = datetime.now().astimezone()
         s = sun(location.observer, date=now.date(), tzinfo=now.tzinfo)
-        
+
         sunrise = s['sunrise']
         sunset = s['sunset']
-        
+
         # Check if current time is between sunrise and sunset
         return sunrise <= now <= sunset
     except Exception as e:
         print(f"Error calculating sun position: {e}")
         # Default to daytime hours (6 AM - 8 PM) as fallback
-        hour = datetime.now().astimezone().hour
-        return 6 <= hour <= 20
+        return 6 <= now.hour <= 20
 
 
-def calculate_solar_update_interval(max_daily_calls: int = 300, usage_percent: float = 0.9) -> int:
+def calculate_solar_update_interval(max_daily_calls: int = 300, usage_percent: float = 0.9,
+                                    now: Optional[datetime] = None) -> int:
     """
     Calculate the optimal interval between solar API calls during daylight hours.
-    
+
     Args:
         max_daily_calls: Maximum API calls allowed per day (default: 300)
         usage_percent: Percentage of available calls to use (default: 0.9 for 90%)
-    
+        now: Reference time (defaults to current local time, injectable for tests)
+
     Returns:
         Interval in minutes between API calls
     """
+    if now is None:
+        now = datetime.now().astimezone()
+
     try:
         # Stockholm coordinates
         location = LocationInfo("Stockholm", "Sweden", "Europe/Stockholm", 59.3293, 18.0686)
-        
+
         # Get today's sun times
-        now = datetime.now().astimezone()
         s = sun(location.observer, date=now.date(), tzinfo=now.tzinfo)
         
         sunrise = s['sunrise']
@@ -98,6 +107,9 @@ class SolarEdgeClient:
         self.api_key: str = api_key or os.getenv('SOLAREDGE_API_KEY')
         self.site_id: str = site_id or os.getenv('SOLAREDGE_SITE_ID')
         self.base_url: str = base_url
+
+        # Reuse a single HTTP session for keep-alive and TLS connection reuse
+        self.session: requests.Session = requests.Session()
         
         if not self.api_key:
             raise ValueError("SolarEdge API key is required. Set SOLAREDGE_API_KEY in .env file or pass as parameter.")
@@ -125,7 +137,7 @@ class SolarEdgeClient:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response: requests.Response = requests.get(url, params=params)
+            response: requests.Response = self.session.get(url, params=params)
             response.raise_for_status()
             
             data: Dict[str, Any] = response.json()
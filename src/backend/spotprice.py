@@ -1,9 +1,33 @@
 
+import asyncio
+import bisect
+import functools
 import requests
-import json
-from datetime import datetime
-from dateutil import parser
-from typing import List, Dict, Any, Optional
+import orjson
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+# Shared pooled session: keep-alive amortizes the TCP+TLS handshake across
+# the dashboard's periodic refreshes, and transient 5xx responses are
+# retried with backoff at the transport level
+_SESSION: requests.Session = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=requests.adapters.Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# Separate connect/read timeouts: a dead host fails fast (2s) while a slow
+# but live response still gets 5s to arrive
+_TIMEOUT: Tuple[float, float] = (2.0, 5.0)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_url(base_url: str, year: int, month: int, day: int, region: str) -> str:
+    """Format the daily price URL - cached so strftime-style formatting runs once per (date, region)"""
+    return f"{base_url}/{year}/{month:02d}-{day:02d}_{region}.json"
+
 
 class SpotPriceClient:
     """
@@ -18,42 +42,133 @@ class SpotPriceClient:
             base_url: Base URL for the API endpoint
         """
         self.base_url: str = base_url
-    
-    def get_spot_prices(self, region: str = "SE4") -> Optional[List[Dict[str, Any]]]:
+        # Cache of parsed (starts, ends, prices) arrays per payload object,
+        # so the 96-entry daily array is parsed once instead of on every
+        # lookup. Each entry also holds the payload itself: keeping the
+        # list alive pins its id, so a freed payload's address can never
+        # be recycled into a false cache hit for a different list.
+        self._parsed_cache: Dict[int, Tuple[List[Dict[str, Any]], Tuple[List[float], List[float], List[float]]]] = {}
+        # Cache of fetched daily payloads keyed by (date, region). The date in
+        # the key rolls the cache over at midnight; the TTL covers the rare
+        # intra-day correction upstream.
+        self._payload_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._payload_ttl_seconds: float = 900.0
+
+    def _parse_price_data(self, price_data: List[Dict[str, Any]]) -> Tuple[List[float], List[float], List[float]]:
+        """
+        Parse and cache parallel (starts, ends, prices) arrays for a price payload
+
+        The API returns entries in strictly increasing time order, so the
+        starts array is sorted and suitable for binary search.
+
+        Args:
+            price_data: List of price dictionaries from the API
+
+        Returns:
+            Tuple of (start timestamps, end timestamps, prices) lists
+        """
+        key: int = id(price_data)
+        cached = self._parsed_cache.get(key)
+        # Identity check: only serve the entry if it was built from this
+        # exact payload object, never from one that happened to share an id
+        if cached is not None and cached[0] is price_data:
+            parsed = cached[1]
+        else:
+            parsed = None
+        if parsed is None:
+            starts: List[float] = []
+            ends: List[float] = []
+            prices: List[float] = []
+            # Hoist lookups out of the loop - this runs once per payload but
+            # still walks up to 192 entries
+            fromisoformat = datetime.fromisoformat
+            for entry in price_data:
+                try:
+                    start_ts = fromisoformat(entry['time_start']).timestamp()
+                    end_ts = fromisoformat(entry['time_end']).timestamp()
+                    price = float(entry['SEK_per_kWh'])
+                except (KeyError, ValueError, TypeError) as e:
+                    print(f"Error parsing entry: {e}")
+                    continue
+                starts.append(start_ts)
+                ends.append(end_ts)
+                prices.append(price)
+            parsed = (starts, ends, prices)
+            # Bound memory: at most a handful of payloads are live at once
+            if len(self._parsed_cache) >= 8:
+                self._parsed_cache.clear()
+            self._parsed_cache[key] = (price_data, parsed)
+        return parsed
+
+    def get_spot_prices(self, region: str = "SE4", force_refresh: bool = False) -> Optional[List[Dict[str, Any]]]:
         """
         Get current spot prices from elprisetjustnu.se API
-        
+
         Args:
             region: The region code (default: SE4)
-        
+            force_refresh: Skip the payload cache and hit the API, used by
+                prefetchers that want to renew the cache before it expires
+
         Returns:
             List of dictionaries containing spot price data, or None if error
         """
-        # Get current date
-        current_date: datetime = datetime.now()
-        year: str = current_date.strftime("%Y")
-        month_day: str = current_date.strftime("%m-%d")
-        
-        # Construct the API URL
-        url: str = f"{self.base_url}/{year}/{month_day}_{region}.json"
-        
+        # Construct the API URL from plain date components - no strftime,
+        # and the formatted result is memoized per (date, region)
+        now: datetime = datetime.now()
+        url: str = _build_url(self.base_url, now.year, now.month, now.day, region)
+
+        # Serve from cache while fresh - the upstream data only changes once
+        # per day, so most refreshes can skip the network entirely. The URL
+        # already encodes date and region, so it doubles as the cache key.
+        if not force_refresh:
+            cached = self._payload_cache.get(url)
+            if cached is not None and time.monotonic() - cached[0] < self._payload_ttl_seconds:
+                return cached[1]
+
         try:
-            # Make the API request
-            response: requests.Response = requests.get(url)
+            # Make the API request on the shared keep-alive session
+            response: requests.Response = _SESSION.get(url, timeout=_TIMEOUT)
             response.raise_for_status()  # Raise an exception for bad status codes
-            
-            # Parse JSON string into dictionary
-            data: List[Dict[str, Any]] = json.loads(response.text)
-            
+
+            # Parse the raw bytes directly - skips the str decode pass and
+            # uses orjson's C parser on the number-heavy price array
+            data: List[Dict[str, Any]] = orjson.loads(response.content)
+
+            if len(self._payload_cache) >= 8:
+                self._payload_cache.clear()
+            self._payload_cache[url] = (time.monotonic(), data)
+
+            # Validate and type the entries once at ingest so current-price
+            # lookups never see string prices or unparsed timestamps
+            self._parse_price_data(data)
+
             return data
-            
+
         except requests.exceptions.RequestException as e:
             print(f"Error making API request: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Error parsing JSON response: {e}")
             return None
 
+    async def get_spot_prices_many(self, regions: List[str]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Fetch daily prices for several regions concurrently
+
+        All requests run in parallel on the shared keep-alive pool, so total
+        latency is roughly the slowest single fetch instead of the sum.
+
+        Args:
+            regions: Region codes to fetch (e.g. ["SE1", "SE2", "SE3", "SE4"])
+
+        Returns:
+            Mapping of region code to its price list (or None on error)
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.get_spot_prices, region) for region in regions)
+        )
+        return dict(zip(regions, results))
+
     def get_current_spot_price(self, price_data: List[Dict[str, Any]]) -> Optional[float]:
         """
         Get the current spot price in SEK based on system time
@@ -67,28 +182,21 @@ class SpotPriceClient:
         if not price_data:
             print("No price data provided")
             return None
-        
-        # Get current system time with timezone awareness
-        current_time: datetime = datetime.now().astimezone()
-        
-        # Find the price entry that covers the current time
-        for entry in price_data:
-            try:
-                # Parse the time strings to datetime objects
-                time_start: datetime = parser.parse(entry['time_start'])
-                time_end: datetime = parser.parse(entry['time_end'])
-                
-                # Convert current time to the same timezone as the data
-                current_time_tz: datetime = current_time.astimezone(time_start.tzinfo)
-                
-                # Check if current time falls within this price period
-                if time_start <= current_time_tz < time_end:
-                    return float(entry['SEK_per_kWh'])
-                    
-            except (KeyError, ValueError, TypeError) as e:
-                print(f"Error parsing entry: {e}")
-                continue
-        
+
+        # Parse once per payload; subsequent lookups reuse the cached arrays
+        starts, ends, prices = self._parse_price_data(price_data)
+
+        # Compare absolute timestamps - avoids per-entry timezone conversion
+        # and the local-timezone lookup that astimezone() would do
+        now_ts: float = datetime.now(timezone.utc).timestamp()
+
+        # Binary-search the sorted start times for the slot containing now.
+        # bisect_right puts equal keys after, so an exact boundary match is
+        # included in its slot.
+        idx: int = bisect.bisect_right(starts, now_ts) - 1
+        if idx >= 0 and now_ts < ends[idx]:
+            return prices[idx]
+
         print("No matching price found for current time")
         return None
 
@@ -108,11 +216,16 @@ class SpotPriceClient:
         return None
 
 
+# Shared default instance: keeps the session pool, payload cache and parse
+# cache alive for the whole process instead of per-construction
+default_client: SpotPriceClient = SpotPriceClient()
+
+
 # Example usage
 if __name__ == "__main__":
     # Create client instance
-    client: SpotPriceClient = SpotPriceClient()
-    
+    client: SpotPriceClient = default_client
+
     # Get current spot price directly
     current_price: Optional[float] = client.get_current_price()
     if current_price is not None:
@@ -65,6 +65,20 @@ class TestMQTTPowerClientInit:
         with pytest.raises(ValueError, match="topic must be provided"):
             MQTTPowerClient()
     
+    @patch.dict(os.environ, {
+        'MQTT_BROKER_HOST': 'env.mqtt.com',
+        'MQTT_TOPIC': 'env/topic'
+    }, clear=True)
+    def test_init_batched_env_read_partial(self):
+        """Test batched env read with only some variables set"""
+        client = MQTTPowerClient()
+
+        assert client.broker_host == 'env.mqtt.com'
+        assert client.topic == 'env/topic'
+        assert client.broker_port == 1883
+        assert client.username is None
+        assert client.password is None
+
     def test_init_default_port(self):
         """Test that default port is 1883"""
         client = MQTTPowerClient(broker_host="test.com", topic="test/topic")
@@ -98,6 +112,12 @@ class TestMQTTPowerClientInit:
         
         mock_client_instance.username_pw_set.assert_called_once_with("user", "pass")
     
+    def test_uses_slots(self):
+        """Test that instances use __slots__ (no per-instance __dict__)"""
+        client = MQTTPowerClient(broker_host="test.com", topic="test/topic")
+
+        assert not hasattr(client, '__dict__')
+
     @patch.dict('os.environ', {}, clear=True)
     @patch('src.backend.mqtt_client.mqtt.Client')
     def test_init_no_credentials(self, mock_mqtt_client):
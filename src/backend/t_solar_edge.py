@@ -9,403 +9,320 @@ Tests cover:
 - Error handling and edge cases
 """
 
+import copy
+import re
 import pytest
+import responses
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
 import requests
 import json
 import os
 from src.backend.solar_edge import (
-    SolarEdgeClient, 
-    is_sun_up, 
+    SolarEdgeClient,
+    is_sun_up,
     calculate_solar_update_interval
 )
 
+# All tests here are independent and fully network-mocked, so any xdist
+# grouping works; keep the module together so its module-scoped fixtures
+# are built once per worker (run with: pytest -n auto). no_cover keeps
+# coverage's profile hook off this mock-heavy module (see conftest.py).
+pytestmark = [pytest.mark.xdist_group("solar_edge"), pytest.mark.no_cover]
+
+
+# Preallocated exception instance - re-raising is cheap, construction is not
+_INVALID_JSON_ERR = json.JSONDecodeError("Invalid JSON", "", 0)
+
+# Frozen reference times, constructed once at import instead of per test
+NOON_UTC = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
+MIDNIGHT_UTC = datetime(2025, 6, 15, 0, 0, tzinfo=timezone.utc)
+AFTERNOON_UTC = datetime(2025, 6, 15, 14, 0, tzinfo=timezone.utc)
+WINTER_NOON_UTC = datetime(2025, 12, 15, 12, 0, tzinfo=timezone.utc)
+
+# Canonical sunrise/sunset pairs shared across the sun-position tests,
+# built once at import instead of per test
+_SUN_CASES = {
+    "daylight": {  # generic is_sun_up window
+        'sunrise': datetime(2025, 6, 15, 4, 30, tzinfo=timezone.utc),
+        'sunset': datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc),
+    },
+    "summer": {  # ~18 hours of daylight
+        'sunrise': datetime(2025, 6, 15, 2, 30, tzinfo=timezone.utc),
+        'sunset': datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc),
+    },
+    "winter": {  # ~6 hours of daylight
+        'sunrise': datetime(2025, 12, 15, 7, 30, tzinfo=timezone.utc),
+        'sunset': datetime(2025, 12, 15, 13, 30, tzinfo=timezone.utc),
+    },
+    "equinox": {  # 12 hours of daylight
+        'sunrise': datetime(2025, 6, 15, 6, 0, tzinfo=timezone.utc),
+        'sunset': datetime(2025, 6, 15, 18, 0, tzinfo=timezone.utc),
+    },
+    "long_day": {  # 20 hours of daylight
+        'sunrise': datetime(2025, 6, 15, 2, 0, tzinfo=timezone.utc),
+        'sunset': datetime(2025, 6, 15, 22, 0, tzinfo=timezone.utc),
+    },
+    "ten_hours": {  # 10 hours of daylight
+        'sunrise': datetime(2025, 6, 15, 7, 0, tzinfo=timezone.utc),
+        'sunset': datetime(2025, 6, 15, 17, 0, tzinfo=timezone.utc),
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def base_response():
+    """Single cached response mock shared by all tests in this module
+
+    A narrow spec list keeps mock attribute access cheap: only the three
+    attributes the client actually touches exist (deliberately not
+    create_autospec(requests.Response), which is far more expensive).
+    """
+    response = Mock(spec=["status_code", "json", "raise_for_status"])
+    response.status_code = 200
+    return response
+
+
+@pytest.fixture(scope="module")
+def make_response(base_response):
+    """Factory that copies the cached base response and sets the JSON payload"""
+    def _make(payload, status=200):
+        response = copy.copy(base_response)
+        response._mock_children = {}  # isolate lazily-created attrs from the shared base
+        response.status_code = status
+        response.json = Mock(return_value=payload)
+        return response
+    return _make
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_dotenv():
+    """Skip filesystem .env parsing for every client built in this module"""
+    with patch('src.backend.solar_edge.load_dotenv'):
+        yield
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Shared SolarEdgeClient - construction is identical across tests"""
+    return SolarEdgeClient(api_key="key", site_id="site")
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    """Single Session.get replacement for the whole module
+
+    Tests set holder["resp"] to the canned response (or holder["exc"] to an
+    exception to raise) instead of stacking @patch decorators on each test.
+    Calls are recorded as (url, kwargs) tuples in holder["calls"]. Patching
+    Session.get covers every client, including the shared module fixture.
+    """
+    holder = {"resp": None, "exc": None, "calls": []}
+
+    def _get(self, url, **kwargs):
+        holder["calls"].append((url, kwargs))
+        if holder["exc"] is not None:
+            raise holder["exc"]
+        return holder["resp"]
+
+    monkeypatch.setattr("src.backend.solar_edge.requests.Session.get", _get)
+    return holder
+
 
 class TestSolarEdgeClient:
     """Test suite for SolarEdgeClient"""
+
+    @pytest.mark.parametrize("env,kwargs,expect", [
+        # Explicit parameters win
+        ({}, {"api_key": "test_key_123", "site_id": "test_site_456"},
+         ("ok", {"api_key": "test_key_123", "site_id": "test_site_456",
+                 "base_url": "https://monitoringapi.solaredge.com"})),
+        # Custom base URL
+        ({}, {"api_key": "key", "site_id": "site",
+              "base_url": "https://custom.solaredge.com"},
+         ("ok", {"base_url": "https://custom.solaredge.com"})),
+        # Environment fallback
+        ({"SOLAREDGE_API_KEY": "env_key", "SOLAREDGE_SITE_ID": "env_site"}, {},
+         ("ok", {"api_key": "env_key", "site_id": "env_site"})),
+        # Validation failures
+        ({}, {}, ("raise", "API key is required")),
+        ({"SOLAREDGE_API_KEY": "key"}, {}, ("raise", "Site ID is required")),
+    ], ids=["parameters", "custom_base_url", "environment",
+            "missing_api_key", "missing_site_id"])
+    def test_init(self, env, kwargs, expect):
+        """Table-driven initialization: parameters, env fallback and validation"""
+        with patch.dict(os.environ, env, clear=True):
+            kind, detail = expect
+            if kind == "raise":
+                with pytest.raises(ValueError, match=detail):
+                    SolarEdgeClient(**kwargs)
+            else:
+                client = SolarEdgeClient(**kwargs)
+                for attr, value in detail.items():
+                    assert getattr(client, attr) == value
     
-    def test_init_with_parameters(self):
-        """Test initialization with explicit parameters"""
-        api_key = "test_key_123"
-        site_id = "test_site_456"
-        
-        client = SolarEdgeClient(api_key=api_key, site_id=site_id)
-        
-        assert client.api_key == api_key
-        assert client.site_id == site_id
-        assert client.base_url == "https://monitoringapi.solaredge.com"
-    
-    def test_init_custom_base_url(self):
-        """Test initialization with custom base URL"""
-        custom_url = "https://custom.solaredge.com"
-        
-        client = SolarEdgeClient(
-            api_key="key",
-            site_id="site",
-            base_url=custom_url
-        )
-        
-        assert client.base_url == custom_url
-    
-    @patch.dict(os.environ, {'SOLAREDGE_API_KEY': 'env_key', 'SOLAREDGE_SITE_ID': 'env_site'})
-    def test_init_from_environment(self):
-        """Test initialization from environment variables"""
-        client = SolarEdgeClient()
-        
-        assert client.api_key == 'env_key'
-        assert client.site_id == 'env_site'
-    
-    @patch('src.backend.solar_edge.load_dotenv')
-    @patch.dict(os.environ, {}, clear=True)
-    def test_init_missing_api_key(self, mock_load_dotenv):
-        """Test initialization fails without API key"""
-        with pytest.raises(ValueError, match="API key is required"):
-            SolarEdgeClient()
-    
-    @patch('src.backend.solar_edge.load_dotenv')
-    @patch.dict(os.environ, {'SOLAREDGE_API_KEY': 'key'}, clear=True)
-    def test_init_missing_site_id(self, mock_load_dotenv):
-        """Test initialization fails without site ID"""
-        with pytest.raises(ValueError, match="Site ID is required"):
-            SolarEdgeClient()
-    
-    @patch('src.backend.solar_edge.requests.get')
-    def test_make_request_success(self, mock_get):
+    def test_make_request_success(self, fake_get, make_response, client):
         """Test successful API request"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
-        mock_get.return_value = mock_response
+        fake_get["resp"] = make_response({"data": "test"})
         
-        client = SolarEdgeClient(api_key="key", site_id="site")
         result = client._make_request("/test/endpoint")
         
         assert result == {"data": "test"}
-        mock_get.assert_called_once()
+        assert len(fake_get["calls"]) == 1
     
-    @patch('src.backend.solar_edge.requests.get')
-    def test_make_request_includes_api_key(self, mock_get):
+    def test_make_request_includes_api_key(self, fake_get, make_response, client):
         """Test that API key is included in request parameters"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {}
-        mock_get.return_value = mock_response
+        fake_get["resp"] = make_response({})
         
-        client = SolarEdgeClient(api_key="secret_key", site_id="site")
         client._make_request("/test")
         
         # Verify API key was added to params
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['api_key'] == 'secret_key'
+        _, kwargs = fake_get["calls"][0]
+        assert kwargs['params']['api_key'] == 'key'
     
-    @patch('src.backend.solar_edge.requests.get')
-    def test_make_request_network_error(self, mock_get):
+    def test_make_request_network_error(self, fake_get, client):
         """Test handling of network errors"""
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
+        fake_get["exc"] = requests.exceptions.RequestException("Network error")
         
-        client = SolarEdgeClient(api_key="key", site_id="site")
         result = client._make_request("/test")
         
         assert result is None
     
-    @patch('src.backend.solar_edge.requests.get')
-    def test_make_request_http_error(self, mock_get):
+    def test_make_request_http_error(self, fake_get, make_response, client):
         """Test handling of HTTP errors (429, 500, etc.)"""
-        mock_response = Mock()
+        mock_response = make_response(None, status=429)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("429 Too Many Requests")
-        mock_get.return_value = mock_response
+        fake_get["resp"] = mock_response
         
-        client = SolarEdgeClient(api_key="key", site_id="site")
         result = client._make_request("/test")
         
         assert result is None
     
-    @patch('src.backend.solar_edge.requests.get')
-    def test_make_request_invalid_json(self, mock_get):
+    def test_make_request_invalid_json(self, fake_get, make_response, client):
         """Test handling of invalid JSON response"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_get.return_value = mock_response
+        mock_response = make_response(None)
+        mock_response.json.side_effect = _INVALID_JSON_ERR
+        fake_get["resp"] = mock_response
         
-        client = SolarEdgeClient(api_key="key", site_id="site")
         result = client._make_request("/test")
         
         assert result is None
     
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_flow_success(self, mock_get):
+    def test_get_current_power_flow_success(self, fake_get, make_response, client):
         """Test successful power flow retrieval"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        fake_get["resp"] = make_response({
             "siteCurrentPowerFlow": {
                 "PV": {"currentPower": 5.5}
             }
-        }
-        mock_get.return_value = mock_response
+        })
         
-        client = SolarEdgeClient(api_key="key", site_id="12345")
         result = client.get_current_power_flow()
         
         assert result is not None
         assert "siteCurrentPowerFlow" in result
     
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_production_success(self, mock_get):
-        """Test successful power production retrieval"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "siteCurrentPowerFlow": {
-                "PV": {"currentPower": 3.5}  # 3.5 kW
-            }
-        }
-        mock_get.return_value = mock_response
-        
-        client = SolarEdgeClient(api_key="key", site_id="site")
-        result = client.get_current_power_production()
-        
-        # Should convert kW to W
-        assert result == 3500.0
-    
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_production_zero(self, mock_get):
-        """Test handling of zero power production (nighttime)"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "siteCurrentPowerFlow": {
-                "PV": {"currentPower": 0}
-            }
-        }
-        mock_get.return_value = mock_response
-        
-        client = SolarEdgeClient(api_key="key", site_id="site")
+    @pytest.mark.parametrize("payload,expected", [
+        # Normal production - should convert kW to W
+        ({"siteCurrentPowerFlow": {"PV": {"currentPower": 3.5}}}, 3500.0),
+        # Zero production (nighttime)
+        ({"siteCurrentPowerFlow": {"PV": {"currentPower": 0}}}, 0.0),
+        # Missing PV key
+        ({"siteCurrentPowerFlow": {}}, None),
+        # Completely malformed response
+        ("unexpected string", None),
+        # Invalid power value
+        ({"siteCurrentPowerFlow": {"PV": {"currentPower": "invalid"}}}, None),
+    ], ids=["success", "zero", "missing_data", "malformed_response", "invalid_power_value"])
+    def test_get_current_power_production(self, fake_get, payload, expected, make_response, client):
+        """Test power production parsing across payload variations"""
+        fake_get["resp"] = make_response(payload)
+
         result = client.get_current_power_production()
-        
-        assert result == 0.0
-    
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_production_api_failure(self, mock_get):
+
+        assert result == expected
+
+    def test_get_current_power_production_api_failure(self, fake_get, client):
         """Test handling when API call fails"""
-        mock_get.side_effect = requests.exceptions.RequestException("API error")
-        
-        client = SolarEdgeClient(api_key="key", site_id="site")
-        result = client.get_current_power_production()
-        
-        assert result is None
-    
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_production_missing_data(self, mock_get):
-        """Test handling of missing PV data in response"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "siteCurrentPowerFlow": {}  # Missing PV key
-        }
-        mock_get.return_value = mock_response
-        
-        client = SolarEdgeClient(api_key="key", site_id="site")
-        result = client.get_current_power_production()
-        
-        assert result is None
-    
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_production_malformed_response(self, mock_get):
-        """Test handling of completely malformed response"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = "unexpected string"
-        mock_get.return_value = mock_response
-        
-        client = SolarEdgeClient(api_key="key", site_id="site")
-        result = client.get_current_power_production()
-        
-        assert result is None
-    
-    @patch('src.backend.solar_edge.requests.get')
-    def test_get_current_power_production_invalid_power_value(self, mock_get):
-        """Test handling of invalid power value"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "siteCurrentPowerFlow": {
-                "PV": {"currentPower": "invalid"}
-            }
-        }
-        mock_get.return_value = mock_response
-        
-        client = SolarEdgeClient(api_key="key", site_id="site")
+        fake_get["exc"] = requests.exceptions.RequestException("API error")
+
         result = client.get_current_power_production()
-        
+
         assert result is None
 
 
 class TestIsSunUp:
     """Test suite for is_sun_up() function"""
     
-    @patch('src.backend.solar_edge.datetime')
     @patch('src.backend.solar_edge.sun')
-    def test_sun_up_during_day(self, mock_sun, mock_datetime):
+    def test_sun_up_during_day(self, mock_sun):
         """Test that function returns True during daylight hours"""
-        # Set time to noon
-        mock_now = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
-        mock_datetime.now.return_value = mock_now
-        
         # Mock sun times
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 6, 15, 4, 30, tzinfo=timezone.utc),
-            'sunset': datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc)
-        }
+        mock_sun.return_value = _SUN_CASES["daylight"]
         
-        result = is_sun_up()
+        # Noon
+        result = is_sun_up(now=NOON_UTC)
         assert result is True
     
-    @patch('src.backend.solar_edge.datetime')
     @patch('src.backend.solar_edge.sun')
-    def test_sun_down_at_night(self, mock_sun, mock_datetime):
+    def test_sun_down_at_night(self, mock_sun):
         """Test that function returns False during nighttime"""
-        # Set time to midnight
-        mock_now = datetime(2025, 6, 15, 0, 0, tzinfo=timezone.utc)
-        mock_datetime.now.return_value = mock_now
-        
         # Mock sun times
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 6, 15, 4, 30, tzinfo=timezone.utc),
-            'sunset': datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc)
-        }
+        mock_sun.return_value = _SUN_CASES["daylight"]
         
-        result = is_sun_up()
+        # Midnight
+        result = is_sun_up(now=MIDNIGHT_UTC)
         assert result is False
     
-    @patch('src.backend.solar_edge.datetime')
+    @pytest.mark.parametrize("when", ["sunrise", "sunset"])
     @patch('src.backend.solar_edge.sun')
-    def test_sun_at_sunrise(self, mock_sun, mock_datetime):
-        """Test at exact sunrise time"""
-        sunrise_time = datetime(2025, 6, 15, 4, 30, tzinfo=timezone.utc)
-        mock_datetime.now.return_value = sunrise_time
-        
-        mock_sun.return_value = {
-            'sunrise': sunrise_time,
-            'sunset': datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc)
-        }
-        
-        result = is_sun_up()
-        # Should be True at sunrise (inclusive)
-        assert result is True
-    
-    @patch('src.backend.solar_edge.datetime')
-    @patch('src.backend.solar_edge.sun')
-    def test_sun_at_sunset(self, mock_sun, mock_datetime):
-        """Test at exact sunset time"""
-        sunset_time = datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc)
-        mock_datetime.now.return_value = sunset_time
-        
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 6, 15, 4, 30, tzinfo=timezone.utc),
-            'sunset': sunset_time
-        }
+    def test_sun_at_boundary(self, mock_sun, when):
+        """Test at the exact sunrise/sunset boundary"""
+        mock_sun.return_value = _SUN_CASES["daylight"]
         
-        result = is_sun_up()
-        # Should be True at sunset (inclusive)
+        result = is_sun_up(now=_SUN_CASES["daylight"][when])
+        # Both boundaries are inclusive
         assert result is True
     
-    @patch('src.backend.solar_edge.datetime')
-    @patch('src.backend.solar_edge.sun')
-    def test_fallback_on_calculation_error(self, mock_sun, mock_datetime):
+    def test_fallback_on_calculation_error(self, monkeypatch):
         """Test fallback to daytime hours when calculation fails"""
-        mock_datetime.now.return_value = datetime(2025, 6, 15, 14, 0, tzinfo=timezone.utc)
-        mock_sun.side_effect = Exception("Calculation error")
+        def _broken_sun(*args, **kwargs):
+            raise Exception("Calculation error")
+        monkeypatch.setattr('src.backend.solar_edge.sun', _broken_sun)
         
         # Should fall back to hour-based check (6 AM - 8 PM)
-        result = is_sun_up()
+        result = is_sun_up(now=AFTERNOON_UTC)
         assert isinstance(result, bool)
 
 
 class TestCalculateSolarUpdateInterval:
     """Test suite for calculate_solar_update_interval() function"""
     
+    @pytest.mark.parametrize("case,max_calls,usage,now", [
+        # ~18 h summer day: 1080 min / 270 calls = 4 min -> clamped to 5
+        ("summer", 300, 0.9, NOON_UTC),
+        # ~6 h winter day: 360 min / 270 calls = 1.3 min -> clamped to 5
+        ("winter", 300, 0.9, WINTER_NOON_UTC),
+        # 12 h with custom parameters: 720 min / 400 calls = 1.8 min -> clamped to 5
+        ("equinox", 500, 0.8, NOON_UTC),
+        # 20 h day with generous limits still respects the floor
+        ("long_day", 1000, 0.95, NOON_UTC),
+    ], ids=["summer", "winter", "custom_parameters", "long_day"])
     @patch('src.backend.solar_edge.sun')
-    @patch('src.backend.solar_edge.datetime')
-    def test_calculate_interval_summer(self, mock_datetime, mock_sun):
-        """Test interval calculation for long summer day"""
-        mock_datetime.now.return_value = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
-        
-        # Summer in Stockholm: ~18 hours of daylight
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 6, 15, 2, 30, tzinfo=timezone.utc),  # ~3:30 AM local
-            'sunset': datetime(2025, 6, 15, 20, 30, tzinfo=timezone.utc)   # ~9:30 PM local
-        }
-        
-        # 18 hours = 1080 minutes
-        # 300 calls * 0.9 = 270 calls
-        # 1080 / 270 = 4 minutes -> adjusted to 5 (minimum)
-        result = calculate_solar_update_interval(max_daily_calls=300, usage_percent=0.9)
-        
-        assert result >= 5  # Should respect minimum
-        assert isinstance(result, int)
-    
-    @patch('src.backend.solar_edge.sun')
-    @patch('src.backend.solar_edge.datetime')
-    def test_calculate_interval_winter(self, mock_datetime, mock_sun):
-        """Test interval calculation for short winter day"""
-        mock_datetime.now.return_value = datetime(2025, 12, 15, 12, 0, tzinfo=timezone.utc)
-        
-        # Winter in Stockholm: ~6 hours of daylight
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 12, 15, 7, 30, tzinfo=timezone.utc),   # ~8:30 AM local
-            'sunset': datetime(2025, 12, 15, 13, 30, tzinfo=timezone.utc)    # ~2:30 PM local
-        }
+    def test_calculate_interval_respects_minimum(self, mock_sun, case, max_calls, usage, now):
+        """Test that the interval never goes below the 5 minute minimum"""
+        mock_sun.return_value = _SUN_CASES[case]
         
-        # 6 hours = 360 minutes
-        # 300 calls * 0.9 = 270 calls
-        # 360 / 270 = 1.3 minutes -> adjusted to 5 (minimum)
-        result = calculate_solar_update_interval(max_daily_calls=300, usage_percent=0.9)
+        result = calculate_solar_update_interval(max_daily_calls=max_calls,
+                                                 usage_percent=usage, now=now)
         
         assert result >= 5
         assert isinstance(result, int)
     
-    def test_calculate_interval_custom_parameters(self):
-        """Test with custom max calls and usage percent"""
-        with patch('src.backend.solar_edge.sun') as mock_sun:
-            with patch('src.backend.solar_edge.datetime') as mock_datetime:
-                mock_datetime.now.return_value = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
-                
-                # 12 hours of daylight = 720 minutes
-                mock_sun.return_value = {
-                    'sunrise': datetime(2025, 6, 15, 6, 0, tzinfo=timezone.utc),
-                    'sunset': datetime(2025, 6, 15, 18, 0, tzinfo=timezone.utc)
-                }
-                
-                # 500 calls * 0.8 = 400 calls
-                # 720 / 400 = 1.8 minutes -> adjusted to 5 (minimum)
-                result = calculate_solar_update_interval(max_daily_calls=500, usage_percent=0.8)
-                
-                assert result >= 5
-    
-    @patch('src.backend.solar_edge.sun')
-    @patch('src.backend.solar_edge.datetime')
-    def test_calculate_interval_respects_minimum(self, mock_datetime, mock_sun):
-        """Test that interval never goes below minimum (5 minutes)"""
-        mock_datetime.now.return_value = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
-        
-        # Very long day: 20 hours
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 6, 15, 2, 0, tzinfo=timezone.utc),
-            'sunset': datetime(2025, 6, 15, 22, 0, tzinfo=timezone.utc)
-        }
-        
-        # Even with many calls allowed, should respect minimum
-        result = calculate_solar_update_interval(max_daily_calls=1000, usage_percent=0.95)
-        
-        assert result >= 5
-    
-    @patch('src.backend.solar_edge.sun')
-    def test_calculate_interval_error_fallback(self, mock_sun):
+    def test_calculate_interval_error_fallback(self, monkeypatch):
         """Test fallback to default when calculation fails"""
-        mock_sun.side_effect = Exception("Calculation error")
+        def _broken_sun(*args, **kwargs):
+            raise Exception("Calculation error")
+        monkeypatch.setattr('src.backend.solar_edge.sun', _broken_sun)
         
         result = calculate_solar_update_interval()
         
@@ -413,39 +330,41 @@ class TestCalculateSolarUpdateInterval:
         assert result == 10
     
     @patch('src.backend.solar_edge.sun')
-    @patch('src.backend.solar_edge.datetime')
-    def test_calculate_interval_low_api_limit(self, mock_datetime, mock_sun):
+    def test_calculate_interval_low_api_limit(self, mock_sun):
         """Test with very low API call limit"""
-        mock_datetime.now.return_value = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
-        
         # 10 hours daylight = 600 minutes
-        mock_sun.return_value = {
-            'sunrise': datetime(2025, 6, 15, 7, 0, tzinfo=timezone.utc),
-            'sunset': datetime(2025, 6, 15, 17, 0, tzinfo=timezone.utc)
-        }
+        mock_sun.return_value = _SUN_CASES["ten_hours"]
         
         # Only 50 calls per day * 0.9 = 45 calls
         # 600 / 45 = 13.3 minutes
-        result = calculate_solar_update_interval(max_daily_calls=50, usage_percent=0.9)
+        result = calculate_solar_update_interval(max_daily_calls=50, usage_percent=0.9,
+                                                 now=NOON_UTC)
         
         assert result >= 13
 
 
 class TestSolarEdgeIntegration:
     """Integration tests combining multiple components"""
-    
-    @patch.dict(os.environ, {'SOLAREDGE_API_KEY': 'test_key', 'SOLAREDGE_SITE_ID': 'test_site'})
-    @patch('src.backend.solar_edge.requests.get')
-    def test_full_power_production_flow(self, mock_get):
-        """Test complete flow from client creation to power retrieval"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "siteCurrentPowerFlow": {
-                "PV": {"currentPower": 4.2}
-            }
-        }
-        mock_get.return_value = mock_response
+
+    @pytest.fixture(autouse=True)
+    def integration_env(self, monkeypatch):
+        """Env vars for the full client construction path"""
+        monkeypatch.setenv('SOLAREDGE_API_KEY', 'test_key')
+        monkeypatch.setenv('SOLAREDGE_SITE_ID', 'test_site')
+
+    @responses.activate
+    def test_full_power_production_flow(self):
+        """Test complete flow from client creation to power retrieval
+
+        Stubs HTTP at the transport layer (responses) so the real requests
+        Session/adapter stack is exercised without any Mock bookkeeping.
+        """
+        responses.add(
+            responses.GET,
+            re.compile(r"https://monitoringapi\.solaredge\.com/.*"),
+            json={"siteCurrentPowerFlow": {"PV": {"currentPower": 4.2}}},
+            status=200,
+        )
         
         # Create client (from environment)
         client = SolarEdgeClient()
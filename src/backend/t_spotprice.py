@@ -29,13 +29,13 @@ class TestSpotPriceClient:
         client = SpotPriceClient(base_url=custom_url)
         assert client.base_url == custom_url
     
-    @patch('src.backend.spotprice.requests.get')
+    @patch('src.backend.spotprice._SESSION.get')
     def test_get_spot_prices_success(self, mock_get):
         """Test successful API call for spot prices"""
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '''[
+        mock_response.content = b'''[
             {
                 "SEK_per_kWh": 0.5,
                 "time_start": "2025-11-04T10:00:00+01:00",
@@ -57,7 +57,7 @@ class TestSpotPriceClient:
         assert result[0]['SEK_per_kWh'] == 0.5
         assert result[1]['SEK_per_kWh'] == 0.6
     
-    @patch('src.backend.spotprice.requests.get')
+    @patch('src.backend.spotprice._SESSION.get')
     def test_get_spot_prices_network_error(self, mock_get):
         """Test handling of network errors"""
         mock_get.side_effect = requests.exceptions.RequestException("Network error")
@@ -67,12 +67,12 @@ class TestSpotPriceClient:
         
         assert result is None
     
-    @patch('src.backend.spotprice.requests.get')
+    @patch('src.backend.spotprice._SESSION.get')
     def test_get_spot_prices_invalid_json(self, mock_get):
         """Test handling of invalid JSON response"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = "Invalid JSON"
+        mock_response.content = b"Invalid JSON"
         mock_get.return_value = mock_response
         
         client = SpotPriceClient()
@@ -80,7 +80,7 @@ class TestSpotPriceClient:
         
         assert result is None
     
-    @patch('src.backend.spotprice.requests.get')
+    @patch('src.backend.spotprice._SESSION.get')
     def test_get_spot_prices_http_error(self, mock_get):
         """Test handling of HTTP errors (404, 500, etc.)"""
         mock_response = Mock()
@@ -99,10 +99,10 @@ class TestSpotPriceClient:
         mock_now = datetime(2025, 11, 4, 15, 30)
         mock_datetime.now.return_value = mock_now
         
-        with patch('src.backend.spotprice.requests.get') as mock_get:
+        with patch('src.backend.spotprice._SESSION.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.text = '[]'
+            mock_response.content = b'[]'
             mock_get.return_value = mock_response
             
             client = SpotPriceClient()
@@ -113,6 +113,35 @@ class TestSpotPriceClient:
             mock_get.assert_called_once()
             assert mock_get.call_args[0][0] == expected_url
     
+    @patch('src.backend.spotprice._SESSION.get')
+    def test_get_spot_prices_cached_within_ttl(self, mock_get):
+        """Test that a repeated fetch for the same day/region skips the network"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'[{"SEK_per_kWh": 0.5, "time_start": "t", "time_end": "t"}]'
+        mock_get.return_value = mock_response
+
+        client = SpotPriceClient()
+        first = client.get_spot_prices("SE4")
+        second = client.get_spot_prices("SE4")
+
+        assert second is first
+        mock_get.assert_called_once()
+
+    @patch('src.backend.spotprice._SESSION.get')
+    def test_get_spot_prices_force_refresh_bypasses_cache(self, mock_get):
+        """Test that force_refresh hits the API even with a fresh cache"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'[]'
+        mock_get.return_value = mock_response
+
+        client = SpotPriceClient()
+        client.get_spot_prices("SE4")
+        client.get_spot_prices("SE4", force_refresh=True)
+
+        assert mock_get.call_count == 2
+
     def test_get_current_spot_price_no_data(self):
         """Test get_current_spot_price with no data"""
         client = SpotPriceClient()
@@ -128,14 +157,13 @@ class TestSpotPriceClient:
         assert result is None
     
     @patch('src.backend.spotprice.datetime')
-    @patch('src.backend.spotprice.parser.parse')
-    def test_get_current_spot_price_matching_time(self, mock_parse, mock_datetime):
+    def test_get_current_spot_price_matching_time(self, mock_datetime):
         """Test finding current price for matching time slot"""
         # Current time: 10:20
         mock_now = datetime(2025, 11, 4, 10, 20, tzinfo=timezone.utc)
         mock_datetime.now.return_value = mock_now
         
-        # Mock parser to return proper datetime objects
+        # Mock fromisoformat to return proper datetime objects
         def parse_side_effect(time_str):
             if "10:00:00" in time_str:
                 return datetime(2025, 11, 4, 10, 0, tzinfo=timezone.utc)
@@ -146,7 +174,7 @@ class TestSpotPriceClient:
             elif "10:45:00" in time_str:
                 return datetime(2025, 11, 4, 10, 45, tzinfo=timezone.utc)
         
-        mock_parse.side_effect = parse_side_effect
+        mock_datetime.fromisoformat.side_effect = parse_side_effect
         
         price_data = [
             {
@@ -206,12 +234,12 @@ class TestSpotPriceClient:
         # Should return None on error
         assert result is None or isinstance(result, float)
     
-    @patch('src.backend.spotprice.requests.get')
+    @patch('src.backend.spotprice._SESSION.get')
     def test_get_current_price_integration(self, mock_get):
         """Test get_current_price convenience method"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '''[
+        mock_response.content = b'''[
             {
                 "SEK_per_kWh": 0.75,
                 "time_start": "2025-11-04T10:00:00+01:00",
@@ -228,7 +256,7 @@ class TestSpotPriceClient:
             
             assert result == 0.75
     
-    @patch('src.backend.spotprice.requests.get')
+    @patch('src.backend.spotprice._SESSION.get')
     def test_get_current_price_api_failure(self, mock_get):
         """Test get_current_price when API fails"""
         mock_get.side_effect = requests.exceptions.RequestException("API error")
@@ -238,12 +266,29 @@ class TestSpotPriceClient:
         
         assert result is None
     
+    def test_get_spot_prices_many(self):
+        """Test concurrent fetch of several regions"""
+        import asyncio
+
+        with patch('src.backend.spotprice._SESSION.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = b'[]'
+            mock_get.return_value = mock_response
+
+            client = SpotPriceClient()
+            result = asyncio.run(client.get_spot_prices_many(["SE1", "SE2", "SE3", "SE4"]))
+
+            assert set(result.keys()) == {"SE1", "SE2", "SE3", "SE4"}
+            assert all(prices == [] for prices in result.values())
+            assert mock_get.call_count == 4
+
     def test_different_regions(self):
         """Test that different regions are handled correctly"""
-        with patch('src.backend.spotprice.requests.get') as mock_get:
+        with patch('src.backend.spotprice._SESSION.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.text = '[]'
+            mock_response.content = b'[]'
             mock_get.return_value = mock_response
             
             client = SpotPriceClient()
@@ -271,28 +316,27 @@ class TestSpotPriceEdgeCases:
             mock_now = datetime(2025, 11, 4, 10, 15, 0, tzinfo=timezone.utc)
             mock_datetime.now.return_value = mock_now
             
-            with patch('src.backend.spotprice.parser.parse') as mock_parse:
-                def parse_side_effect(time_str):
-                    if "10:15:00" in time_str:
-                        return datetime(2025, 11, 4, 10, 15, tzinfo=timezone.utc)
-                    elif "10:30:00" in time_str:
-                        return datetime(2025, 11, 4, 10, 30, tzinfo=timezone.utc)
-                
-                mock_parse.side_effect = parse_side_effect
-                
-                price_data = [
-                    {
-                        "SEK_per_kWh": 0.6,
-                        "time_start": "2025-11-04T10:15:00+00:00",
-                        "time_end": "2025-11-04T10:30:00+00:00"
-                    }
-                ]
-                
-                client = SpotPriceClient()
-                result = client.get_current_spot_price(price_data)
-                
-                # Should include the start boundary
-                assert result == 0.6
+            def parse_side_effect(time_str):
+                if "10:15:00" in time_str:
+                    return datetime(2025, 11, 4, 10, 15, tzinfo=timezone.utc)
+                elif "10:30:00" in time_str:
+                    return datetime(2025, 11, 4, 10, 30, tzinfo=timezone.utc)
+            
+            mock_datetime.fromisoformat.side_effect = parse_side_effect
+            
+            price_data = [
+                {
+                    "SEK_per_kWh": 0.6,
+                    "time_start": "2025-11-04T10:15:00+00:00",
+                    "time_end": "2025-11-04T10:30:00+00:00"
+                }
+            ]
+
+            client = SpotPriceClient()
+            result = client.get_current_spot_price(price_data)
+
+            # Should include the start boundary
+            assert result == 0.6
     
     def test_timezone_conversion(self):
         """Test that timezone conversion works correctly"""
@@ -301,32 +345,31 @@ class TestSpotPriceEdgeCases:
         
         # Create price data with CET timezone
         with patch('src.backend.spotprice.datetime') as mock_datetime:
-            with patch('src.backend.spotprice.parser.parse') as mock_parse:
-                # Current time in CET (UTC+1)
-                from datetime import timezone as tz
-                cet = tz(timedelta(hours=1))
-                mock_now = datetime(2025, 11, 4, 10, 20, tzinfo=cet)
-                mock_datetime.now.return_value = mock_now
-                
-                # Parse returns UTC times
-                def parse_side_effect(time_str):
-                    if "10:15:00" in time_str:
-                        return datetime(2025, 11, 4, 9, 15, tzinfo=timezone.utc)  # 10:15 CET = 09:15 UTC
-                    elif "10:30:00" in time_str:
-                        return datetime(2025, 11, 4, 9, 30, tzinfo=timezone.utc)  # 10:30 CET = 09:30 UTC
-                
-                mock_parse.side_effect = parse_side_effect
-                
-                price_data = [
-                    {
-                        "SEK_per_kWh": 0.88,
-                        "time_start": "2025-11-04T10:15:00+01:00",
-                        "time_end": "2025-11-04T10:30:00+01:00"
-                    }
-                ]
-                
-                result = client.get_current_spot_price(price_data)
-                assert result == 0.88
+            # Current time in CET (UTC+1)
+            from datetime import timezone as tz
+            cet = tz(timedelta(hours=1))
+            mock_now = datetime(2025, 11, 4, 10, 20, tzinfo=cet)
+            mock_datetime.now.return_value = mock_now
+
+            # Parse returns UTC times
+            def parse_side_effect(time_str):
+                if "10:15:00" in time_str:
+                    return datetime(2025, 11, 4, 9, 15, tzinfo=timezone.utc)  # 10:15 CET = 09:15 UTC
+                elif "10:30:00" in time_str:
+                    return datetime(2025, 11, 4, 9, 30, tzinfo=timezone.utc)  # 10:30 CET = 09:30 UTC
+
+            mock_datetime.fromisoformat.side_effect = parse_side_effect
+
+            price_data = [
+                {
+                    "SEK_per_kWh": 0.88,
+                    "time_start": "2025-11-04T10:15:00+01:00",
+                    "time_end": "2025-11-04T10:30:00+01:00"
+                }
+            ]
+
+            result = client.get_current_spot_price(price_data)
+            assert result == 0.88
 
 
 if __name__ == "__main__":
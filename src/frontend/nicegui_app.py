@@ -7,29 +7,126 @@ Real-time web dashboard for monitoring Swedish electricity spot prices
 and household power consumption.
 """
 
-from nicegui import ui, app
+from nicegui import ui, app, binding
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any
 import asyncio
+import functools
+import logging
+import time
 from asyncio import get_running_loop, new_event_loop, set_event_loop
-from src.backend.spotprice import SpotPriceClient
+from src.backend.spotprice import SpotPriceClient, default_client as default_spot_price_client
 from src.backend.mqtt_client import MQTTPowerClient
 from src.backend.solar_edge import SolarEdgeClient, is_sun_up, calculate_solar_update_interval
 from src.application.data_manager import DataManager
 
 
+# Cached local timezone for get_current_time; refreshed on a short TTL so
+# the per-call offset resolution is amortized away on the MQTT hot path
+# while DST changes are still picked up within a minute
+_local_tz = None
+_local_tz_expiry: float = 0.0
+
+# Periodic-path diagnostics go through a gated logger so the recurring
+# fetch paths do no string formatting or stdout writes in production;
+# one-time startup messages stay on print
+logger = logging.getLogger(__name__)
+
+
 def get_current_time() -> datetime:
-    """Get current time with proper timezone handling (local time)"""
-    return datetime.now().astimezone()
+    """Get current time with proper timezone handling (local time)
 
+    MQTT packets arrive at wire rate and each one used to re-derive the
+    local UTC offset via astimezone(); the offset is now cached briefly and
+    the common case is a single datetime.now(tz) call.
+    """
+    global _local_tz, _local_tz_expiry
+    now = time.time()
+    if now >= _local_tz_expiry:
+        _local_tz = datetime.now().astimezone().tzinfo
+        _local_tz_expiry = now + 60.0
+    return datetime.now(_local_tz)
 
-def format_timestamp(dt: datetime) -> str:
-    """Format datetime to string with timezone awareness"""
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp_cached(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
+
+def format_timestamp(dt: datetime) -> str:
+    """Format datetime to string with timezone awareness
+
+    Memoized on whole seconds: repeated calls within the same second (MQTT
+    bursts) reuse the cached strftime result.
+    """
+    return _format_timestamp_cached(dt.replace(microsecond=0))
+
+
+
+
+# Shared UI class strings, defined once so repeated cards and labels reuse
+# the same constants instead of scattering literal copies through build_ui
+_CARD_CLASSES = 'w-full max-w-lg p-6'
+_CARD_CLASSES_STACKED = 'w-full max-w-lg p-6 mt-4'
+_SECTION_TITLE_CLASSES = 'text-2xl font-semibold mb-4'
+_MUTED_TEXT_CLASSES = 'text-sm text-gray-600'
+_ERROR_TEXT_CLASSES = 'text-sm text-red-600'
+_CENTER_COLUMN_CLASSES = 'items-center gap-1'
+
+# Status strings shared between the refreshable power card (re-rendered
+# per update) and the solar binding lambdas (re-evaluated per change) -
+# defined once instead of repeated literals at each use site
+_MQTT_CONNECTED_TEXT = '🟢 MQTT Connected'
+_WARN_PREFIX = '⚠️'
+_SOLAR_STATUS_UNKNOWN = '❓ Status unknown'
+_SOLAR_STATUS_PRODUCING = '☀️ Producing power'
+_SOLAR_STATUS_IDLE = '🌙 No production'
+
+# How long before each quarter-hour boundary the daily price payload is
+# prefetched, so the boundary refresh never waits on the upstream API
+_PRICE_PREFETCH_SECS = 30.0
+
+
+def _read_version() -> str:
+    """Read version from version.txt file"""
+    try:
+        from pathlib import Path
+        import os
+        # Try multiple possible locations for version.txt
+        possible_paths = [
+            Path(__file__).parent.parent.parent / 'version.txt',  # Relative to this file
+            Path('/app/version.txt'),  # Docker container location
+            Path(os.getcwd()) / 'version.txt',  # Current working directory
+        ]
+
+        for version_file in possible_paths:
+            if version_file.exists():
+                version = version_file.read_text().strip()
+                return version
+    except Exception as e:
+        print(f"Could not read version: {e}")
+    return "unknown"
+
+
+# Resolved once at import: the version cannot change while the process is
+# running, so page builds reuse the constant instead of re-statting paths
+_VERSION = _read_version()
+
 class SpotPriceDashboard:
     """Main dashboard class for managing spot price and power monitoring"""
-    
+
+    # Reactive state: labels are bound to these once in build_ui, so plain
+    # attribute assignment propagates to every connected client and only
+    # actual changes are pushed - no polling refresh needed
+    current_price = binding.BindableProperty()
+    error_message = binding.BindableProperty()
+    last_updated = binding.BindableProperty()
+    loading = binding.BindableProperty()
+    current_solar_power = binding.BindableProperty()
+    solar_error = binding.BindableProperty()
+    solar_last_updated = binding.BindableProperty()
+    solar_available = binding.BindableProperty()
+
     def __init__(self, 
                  data_manager: DataManager,
                  spot_price_client: Optional[SpotPriceClient] = None,
@@ -44,7 +141,7 @@ class SpotPriceDashboard:
         """
         # Injected dependencies
         self.data_manager = data_manager
-        self.spot_price_client = spot_price_client or SpotPriceClient()
+        self.spot_price_client = spot_price_client or default_spot_price_client
         self.solar_client = solar_client
         
         # Spot price state
@@ -74,43 +171,74 @@ class SpotPriceDashboard:
         self.price_updated_label: Optional[ui.label] = None
         self.price_spinner: Optional[ui.spinner] = None
         
-        self.power_label: Optional[ui.label] = None
-        self.power_status_label: Optional[ui.label] = None
-        self.power_error_label: Optional[ui.label] = None
-        self.power_updated_label: Optional[ui.label] = None
-        self.power_connecting_container: Optional[ui.element] = None
-        self.power_data_container: Optional[ui.element] = None
-        
         self.solar_label: Optional[ui.label] = None
         self.solar_status_label: Optional[ui.label] = None
         self.solar_error_label: Optional[ui.label] = None
         self.solar_updated_label: Optional[ui.label] = None
         self.solar_data_container: Optional[ui.element] = None
-        
+
+        # Event used to hand MQTT power updates over to the UI event loop;
+        # set thread-safely from the paho network thread
+        self._power_event: asyncio.Event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._background_started: bool = False
+        # Set when power data arrives before the event loop is running, so
+        # the first flush after startup picks the update up
+        self._power_dirty: bool = False
+        # Monotonic stamp of the last DataManager write made with zero
+        # clients connected, used to downsample the headless write rate
+        self._last_headless_write: float = 0.0
+
+        # Single-flight guards: concurrent callers (boundary loop, startup
+        # task, background loop) coalesce into one upstream request
+        self._price_fetch_lock: asyncio.Lock = asyncio.Lock()
+        self._solar_fetch_lock: asyncio.Lock = asyncio.Lock()
+
         # Initialize data collection (happens at app startup, runs continuously)
         # These operations are independent of web client connections
         self.setup_mqtt()  # Connects to MQTT broker for real-time power data
-        self.fetch_spot_price()  # Fetches initial spot price
         self.check_solar_availability()  # Checks if solar monitoring is configured
+        # The initial spot price fetch is scheduled on the event loop in
+        # start_background_updates so the constructor never blocks on HTTP
         
         # Track the last update time
-        self.last_price_update: Optional[datetime] = None  
+        self.last_price_update: Optional[datetime] = None
         self.last_solar_update: Optional[datetime] = None  # Track last solar update
+        # Monotonic fetch ages for elapsed-time checks - immune to wall-clock
+        # jumps and cheaper than constructing tz-aware datetimes
+        self._last_fetch_monotonic: Optional[float] = None
+        self._last_solar_fetch_monotonic: Optional[float] = None
         
         # Calculate optimal solar update interval
         if self.solar_available:
             self.solar_update_interval = calculate_solar_update_interval()
 
-        # Start background updates (runs continuously, independent of web clients)
-        self.start_background_updates()
+        # Background updates are hooked to app.on_startup at module scope so
+        # they run exactly once per process, on the server's running loop
     
     def power_update_callback(self, power: float) -> None:
-        """Callback for MQTT power updates."""
+        """Callback for MQTT power updates (fires on the paho network thread)."""
+        # With no browsers connected there is nobody to show the data to,
+        # so downsample to 1 Hz - enough for InfluxDB logging to continue -
+        # and skip the UI signalling entirely
+        if not self.data_manager.has_connected_clients():
+            now = time.monotonic()
+            if now - self._last_headless_write < 1.0:
+                return
+            self._last_headless_write = now
+            self.data_manager.update_power_data(power, get_current_time())
+            return
+
         # Update data via data manager
         self.data_manager.update_power_data(power, get_current_time())
-        
-        # Trigger UI update
-        self.update_power_ui()
+
+        # Signal the UI loop instead of touching UI elements from this thread
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._power_event.set)
+        else:
+            # Loop not up yet: mark the sample dirty rather than pushing UI
+            # updates from the paho network thread
+            self._power_dirty = True
     
     def setup_mqtt(self):
         """Initialize MQTT connection"""
@@ -148,8 +276,8 @@ class SpotPriceDashboard:
             self.solar_available = True
             self.solar_error = ""
             print("SolarEdge configuration found")
-            # Try to fetch initial data
-            self.fetch_solar_power()
+            # The initial fetch is scheduled on the event loop alongside the
+            # spot price fetch so availability checking stays HTTP-free
         except ValueError as e:
             self.solar_available = False
             self.solar_error = "SolarEdge not configured"
@@ -161,8 +289,21 @@ class SpotPriceDashboard:
             self.solar_client = None
             print(f"SolarEdge exception: {e}")
     
+    async def fetch_solar_power_async(self):
+        """Fetch solar production without blocking the event loop
+
+        Like fetch_spot_price_async, the blocking SolarEdge API call runs on
+        a worker thread so WebSocket traffic keeps flowing meanwhile. A
+        fetch already in flight makes concurrent callers bail out instead
+        of queueing duplicate API hits.
+        """
+        if self._solar_fetch_lock.locked():
+            return
+        async with self._solar_fetch_lock:
+            await asyncio.to_thread(self.fetch_solar_power)
+
     def fetch_solar_power(self):
-        """Fetch the current solar power production"""
+        """Fetch the current solar power production (blocking)"""
         if not self.solar_available or self.solar_client is None:
             return
         
@@ -172,8 +313,9 @@ class SpotPriceDashboard:
                 self.current_solar_power = round(power, 2)
                 self.solar_last_updated = format_timestamp(get_current_time())
                 self.last_solar_update = get_current_time()  # Track update time
+                self._last_solar_fetch_monotonic = time.monotonic()
                 self.solar_error = ""
-                print(f"Solar power updated: {power}W")
+                logger.debug("Solar power updated: %sW", power)
                 
                 # Update data manager for InfluxDB logging
                 self.data_manager.update_solar_production(self.current_solar_power)
@@ -181,156 +323,148 @@ class SpotPriceDashboard:
                 self.solar_error = "No solar data available"
         except Exception as e:
             self.solar_error = f"Solar error: {str(e)}"
-            print(f"Solar fetch error: {e}")
-        
-        self.update_solar_ui()
-    
+            logger.error("Solar fetch error: %s", e)
+
+    async def fetch_spot_price_async(self):
+        """Fetch the latest spot price without blocking the event loop
+
+        Runs the synchronous HTTP fetch on a worker thread so the UI stays
+        responsive for the duration of the network round trip. The lock
+        makes the fetch single-flight: if one is already running, later
+        callers return immediately and reuse its result via current_price.
+        """
+        if self._price_fetch_lock.locked():
+            return
+        async with self._price_fetch_lock:
+            await asyncio.to_thread(self.fetch_spot_price)
+
     def fetch_spot_price(self):
-        """Fetch the latest spot price from the API"""
+        """Fetch the latest spot price from the API (blocking)"""
         try:
             self.current_price = self.spot_price_client.get_current_price()
+            self._last_fetch_monotonic = time.monotonic()
             self.last_price_update = get_current_time()
             self.last_updated = format_timestamp(self.last_price_update)  # Update last_updated
-            print(f"Spot price updated: {self.current_price} at {self.last_price_update}")
+            logger.debug("Spot price updated: %s at %s", self.current_price, self.last_price_update)
             
             # Update data manager for InfluxDB logging
             if self.current_price is not None:
                 self.data_manager.update_spot_price(self.current_price)
-            
-            self.update_price_ui()  # Ensure UI is updated
         except Exception as e:
-            print(f"Error fetching spot price: {e}")
+            logger.error("Error fetching spot price: %s", e)
 
-    def check_and_refresh_spot_price(self):
-        """Check if we've crossed a 15-minute boundary and refresh spot price if needed"""
-        now = get_current_time()
-        current_minute = now.minute
-        
-        # Check if we're at a 15-minute boundary (0, 15, 30, 45)
-        if current_minute % 15 == 0:
-            # Only refresh if we haven't updated in the last minute
-            if self.last_updated:
-                last_update_time = datetime.strptime(self.last_updated, "%Y-%m-%d %H:%M:%S").astimezone()
-                time_since_update = (now - last_update_time).total_seconds()
-                
-                # Refresh if it's been more than 60 seconds
-                if time_since_update > 60:
-                    print(f"15-minute boundary detected, refreshing spot price")
-                    self.fetch_spot_price()
-            else:
-                # No previous update, fetch now
-                self.fetch_spot_price()
-    
     def set_region(self, new_region: str):
         """Set the region and fetch new price"""
         self.region = new_region
         self.fetch_spot_price()
     
-    def update_price_ui(self):
-        """Update the spot price UI elements"""
-        if self.price_spinner:
-            self.price_spinner.visible = self.loading
-        
-        if self.price_label:
-            if self.current_price is not None:
-                self.price_label.text = f"{self.current_price:.2f} SEK/kWh"
-                self.price_label.visible = True
-            else:
-                self.price_label.visible = False
-        
-        if self.price_info_label:
-            # Hide the info label to save space on mobile
-            self.price_info_label.visible = False
-        
-        if self.price_error_label:
-            self.price_error_label.text = self.error_message
-            self.price_error_label.visible = bool(self.error_message)
-        
-        if self.price_updated_label:
-            self.price_updated_label.text = f"Last updated: {self.last_updated}" if self.last_updated else ""
-            self.price_updated_label.visible = bool(self.last_updated)
-    
+    @ui.refreshable
+    def power_section(self):
+        """Render the power consumption card content from current state
+
+        Declared ui.refreshable so a single refresh() re-renders this section
+        for every connected client from the same state snapshot, instead of
+        each client holding its own label handles.
+        """
+        if not self.mqtt_connected:
+            # Connecting state
+            with ui.column().classes('items-center gap-2'):
+                ui.label('Connecting to power monitoring...')
+                ui.spinner(size='md')
+        elif self.current_power is not None:
+            # Connected state
+            with ui.column().classes(_CENTER_COLUMN_CLASSES):
+                ui.label(f"{self.current_power:.0f} W").classes('text-3xl font-bold text-orange-600')
+
+        if self.mqtt_connected:
+            ui.label(_MQTT_CONNECTED_TEXT).classes('text-sm text-green-600')
+
+        if self.mqtt_error:
+            ui.label(f"{_WARN_PREFIX} {self.mqtt_error}").classes(_ERROR_TEXT_CLASSES)
+
+        if self.power_last_updated:
+            ui.label(f"Last updated: {self.power_last_updated}").classes(_MUTED_TEXT_CLASSES)
+
     def update_power_ui(self):
-        """Update the power consumption UI elements"""
+        """Update power state and broadcast one refresh to all clients"""
         # Read latest data from data manager
         latest_data = self.data_manager.get_latest_power_data()
-        
+
         if latest_data:
             self.current_power = latest_data['power']
             self.power_last_updated = format_timestamp(latest_data['timestamp'])
             self.mqtt_error = ""
-        
-        # Update UI elements
-        if self.power_connecting_container:
-            self.power_connecting_container.visible = not self.mqtt_connected
-        
-        if self.power_data_container:
-            self.power_data_container.visible = self.mqtt_connected
-        
-        if self.power_label and self.current_power is not None:
-            self.power_label.text = f"{self.current_power:.0f} W"
-        
-        if self.power_status_label:
-            self.power_status_label.visible = self.mqtt_connected
-        
-        if self.power_error_label:
-            self.power_error_label.text = f"⚠️ {self.mqtt_error}" if self.mqtt_error else ""
-            self.power_error_label.visible = bool(self.mqtt_error)
-        
-        if self.power_updated_label:
-            self.power_updated_label.text = f"Last updated: {self.power_last_updated}" if self.power_last_updated else ""
-            self.power_updated_label.visible = bool(self.power_last_updated)
-    
-    def update_solar_ui(self):
-        """Update the solar power UI elements"""
-        if not self.solar_available:
-            if self.solar_data_container:
-                self.solar_data_container.visible = False
-            return
-        
-        if self.solar_data_container:
-            self.solar_data_container.visible = True
-        
-        if self.solar_label and self.current_solar_power is not None:
-            # Display in W if less than 1000W, otherwise in kW
-            if self.current_solar_power < 1000:
-                self.solar_label.text = f"{self.current_solar_power:.1f} W"
-                print(f"DEBUG: Updated solar UI label to {self.current_solar_power:.1f} W")
-            else:
-                power_kw = self.current_solar_power / 1000
-                self.solar_label.text = f"{power_kw:.2f} kW"
-                print(f"DEBUG: Updated solar UI label to {power_kw:.2f} kW")
-        elif self.solar_label is None:
-            print("DEBUG: solar_label is None")
-        elif self.current_solar_power is None:
-            print(f"DEBUG: current_solar_power is None")
-        
-        if self.solar_status_label:
-            if self.current_solar_power is not None:
-                if self.current_solar_power > 0:
-                    self.solar_status_label.text = "☀️ Producing power"
-                else:
-                    self.solar_status_label.text = "🌙 No production"
-            else:
-                self.solar_status_label.text = "❓ Status unknown"
-        
-        if self.solar_error_label:
-            self.solar_error_label.text = f"⚠️ {self.solar_error}" if self.solar_error else ""
-            self.solar_error_label.visible = bool(self.solar_error)
-        
-        if self.solar_updated_label:
-            self.solar_updated_label.text = f"Last updated: {self.solar_last_updated}" if self.solar_last_updated else ""
-            self.solar_updated_label.visible = bool(self.solar_last_updated)
+
+        self.power_section.refresh()
     
     def start_background_updates(self):
-        """Start the background task for periodic updates."""
+        """Start the background tasks, once per process
+
+        Guarded so repeated calls (e.g. from page builds) cannot spawn a
+        second set of update loops; the tasks serve all connected clients.
+        """
+        if self._background_started:
+            return
+        self._background_started = True
         try:
             loop = get_running_loop()
         except RuntimeError:
             loop = new_event_loop()
             set_event_loop(loop)
+        self._loop = loop
+        if self._power_dirty:
+            # Flush any power sample that arrived before the loop started
+            self._power_dirty = False
+            self._power_event.set()
+        if self.last_price_update is None:
+            # Initial fetch, moved out of the constructor
+            loop.create_task(self.fetch_spot_price_async())
+        if self.solar_available and self.last_solar_update is None:
+            loop.create_task(self.fetch_solar_power_async())
         loop.create_task(self.background_update_loop())
-    
+        loop.create_task(self.power_update_loop())
+        loop.create_task(self.spot_price_refresh_loop())
+
+    async def spot_price_refresh_loop(self):
+        """Refresh the spot price exactly at each quarter-hour boundary
+
+        Sleeps until the next boundary instead of waking every minute to
+        check whether one was crossed: four wakeups per hour, no drift
+        arithmetic, and the new price lands right when it takes effect.
+
+        Shortly before each boundary the daily payload is prefetched on a
+        worker thread, so the refresh at the boundary itself resolves the
+        new slot from the warm cache with zero network latency.
+        """
+        while True:
+            now = get_current_time()
+            seconds_past = (now.minute % 15) * 60 + now.second + now.microsecond / 1e6
+            seconds_to_boundary = 15 * 60 - seconds_past
+            if seconds_to_boundary > _PRICE_PREFETCH_SECS:
+                # Wake early to warm the payload cache before the boundary
+                await asyncio.sleep(seconds_to_boundary - _PRICE_PREFETCH_SECS)
+                await asyncio.to_thread(
+                    self.spot_price_client.get_spot_prices, self.region, True)
+                seconds_to_boundary = _PRICE_PREFETCH_SECS
+            # Small guard so the wakeup is safely past the boundary
+            await asyncio.sleep(seconds_to_boundary + 1.0)
+            await self.fetch_spot_price_async()
+
+    async def power_update_loop(self):
+        """Update the power UI only when MQTT delivers new data
+
+        Event-driven instead of polling: the MQTT callback sets the event
+        thread-safely, so the UI sees each update immediately and idles
+        between them. A short sleep after each refresh coalesces message
+        bursts - packets arriving during the pause fold into one refresh,
+        capping the UI push rate at 20 Hz regardless of meter rate.
+        """
+        while True:
+            await self._power_event.wait()
+            await asyncio.sleep(0.05)
+            self._power_event.clear()
+            self.update_power_ui()
+
     async def background_update_loop(self):
         """Background task to update spot price and solar power periodically"""
         last_interval_update = None
@@ -341,38 +475,33 @@ class SpotPriceDashboard:
             # Get connected clients count from data manager
             has_clients = self.data_manager.has_connected_clients()
             
-            # Recalculate solar update interval daily (at midnight or on first run)
-            now = get_current_time()
-            if last_interval_update is None or now.date() != last_interval_update.date():
-                if self.solar_available:
+            # Recalculate solar update interval daily (at midnight or on
+            # first run). This genuinely needs calendar time, so it is the
+            # only datetime constructed on the tick.
+            if self.solar_available:
+                now = get_current_time()
+                if last_interval_update is None or now.date() != last_interval_update.date():
                     self.solar_update_interval = calculate_solar_update_interval()
                     last_interval_update = now
-            
+
             # Update solar power with optimizations:
             # 1. Only if solar is available
             # 2. Only if sun is up
             # 3. Only if clients are connected
             # 4. Using adaptive interval based on API limits
             if self.solar_available and has_clients and is_sun_up():
-                if self.last_solar_update is None:
+                if self._last_solar_fetch_monotonic is None:
                     # First update
-                    self.fetch_solar_power()
+                    await self.fetch_solar_power_async()
                 else:
-                    minutes_since_update = (now - self.last_solar_update).total_seconds() / 60
-                    if minutes_since_update >= self.solar_update_interval:
-                        self.fetch_solar_power()
-            
-            # Update spot price when crossing 15-minute boundaries (0, 15, 30, 45)
-            current_quarter = now.minute // 15  # 0, 1, 2, or 3
+                    # Monotonic interval check - no datetime arithmetic and
+                    # immune to wall-clock adjustments
+                    elapsed = time.monotonic() - self._last_solar_fetch_monotonic
+                    if elapsed >= self.solar_update_interval * 60:
+                        await self.fetch_solar_power_async()
             
-            if self.last_price_update is None:
-                # First update
-                self.fetch_spot_price()
-            else:
-                last_quarter = self.last_price_update.minute // 15
-                # Check if we've crossed into a new 15-minute period
-                if current_quarter != last_quarter or now.hour != self.last_price_update.hour:
-                    self.fetch_spot_price()
+            # Spot price refreshes are handled by spot_price_refresh_loop,
+            # which wakes exactly at each quarter-hour boundary
 
     def build_ui(self):
         """Build the user interface"""
@@ -380,83 +509,83 @@ class SpotPriceDashboard:
             # Header
             ui.label('Sotehus').classes('text-6xl font-bold')
             
-            # Spot Price Section
-            with ui.card().classes('w-full max-w-lg p-6'):
+            # Spot Price Section - labels are bound to the dashboard's
+            # reactive state, so later attribute assignments propagate
+            # automatically and only on actual change
+            with ui.card().classes(_CARD_CLASSES):
                 with ui.column().classes('items-center gap-4'):
                     self.price_spinner = ui.spinner(size='lg')
-                    self.price_spinner.visible = self.loading
-                    
-                    with ui.column().classes('items-center gap-1'):
+                    self.price_spinner.bind_visibility_from(self, 'loading')
+
+                    with ui.column().classes(_CENTER_COLUMN_CLASSES):
                         self.price_label = ui.label().classes('text-4xl font-bold')
+                        self.price_label.bind_text_from(
+                            self, 'current_price',
+                            lambda v: f"{v:.2f} SEK/kWh" if v is not None else "")
+                        self.price_label.bind_visibility_from(
+                            self, 'current_price', lambda v: v is not None)
+                        # Info label stays hidden to save space on mobile
                         self.price_info_label = ui.label().classes('text-base')
-                    
+                        self.price_info_label.visible = False
+
                     self.price_error_label = ui.label().classes('text-red-600')
-                    self.price_updated_label = ui.label().classes('text-sm text-gray-600')
+                    self.price_error_label.bind_text_from(self, 'error_message')
+                    self.price_error_label.bind_visibility_from(
+                        self, 'error_message', lambda v: bool(v))
+                    self.price_updated_label = ui.label().classes(_MUTED_TEXT_CLASSES)
+                    self.price_updated_label.bind_text_from(
+                        self, 'last_updated',
+                        lambda v: f"Last updated: {v}" if v else "")
+                    self.price_updated_label.bind_visibility_from(
+                        self, 'last_updated', lambda v: bool(v))
             
             # Power Consumption Section
-            with ui.card().classes('w-full max-w-lg p-6 mt-4'):
+            with ui.card().classes(_CARD_CLASSES_STACKED):
                 with ui.column().classes('items-center gap-3'):
-                    ui.label('🏠 Grid Consumption').classes('text-2xl font-semibold mb-4')
-                    
-                    # Connecting state
-                    with ui.column().classes('items-center gap-2') as self.power_connecting_container:
-                        ui.label('Connecting to power monitoring...')
-                        ui.spinner(size='md')
-                    
-                    # Connected state
-                    with ui.column().classes('items-center gap-1') as self.power_data_container:
-                        self.power_label = ui.label().classes('text-3xl font-bold text-orange-600')
-                    
-                    # Status labels
-                    self.power_status_label = ui.label('🟢 MQTT Connected').classes('text-sm text-green-600')
-                    self.power_error_label = ui.label('🟢 MQTT Connected').classes('text-sm text-red-600')
-                    self.power_updated_label = ui.label('🟢 MQTT Connected').classes('text-sm text-gray-600')
+                    ui.label('🏠 Grid Consumption').classes(_SECTION_TITLE_CLASSES)
+                    self.power_section()
             
-            # Solar Power Section
-            with ui.card().classes('w-full max-w-lg p-6 mt-4'):
-                with ui.column().classes('items-center gap-3'):
-                    ui.label('☀️ Solar Production').classes('text-2xl font-semibold mb-4')
-                    
-                    # Solar data display
-                    with ui.column().classes('items-center gap-1') as self.solar_data_container:
-                        self.solar_label = ui.label().classes('text-3xl font-bold text-yellow-600')
-                    
-                    # Status labels
-                    self.solar_status_label = ui.label().classes('text-sm text-gray-600')
-                    self.solar_error_label = ui.label().classes('text-sm text-red-600')
-                    self.solar_updated_label = ui.label().classes('text-sm text-gray-600')
+            # Solar Power Section - bound to reactive state like the price
+            # card. solar_available is fixed at startup, so when SolarEdge
+            # is not configured the card (and all its bindings) is simply
+            # never built - no hidden elements or per-update toggling.
+            if self.solar_available:
+                with ui.card().classes(_CARD_CLASSES_STACKED):
+                    with ui.column().classes('items-center gap-3'):
+                        ui.label('☀️ Solar Production').classes(_SECTION_TITLE_CLASSES)
+
+                        # Solar data display
+                        with ui.column().classes(_CENTER_COLUMN_CLASSES) as self.solar_data_container:
+                            self.solar_label = ui.label().classes('text-3xl font-bold text-yellow-600')
+                            self.solar_label.bind_text_from(
+                                self, 'current_solar_power',
+                                lambda v: "" if v is None else (f"{v:.1f} W" if v < 1000 else f"{v / 1000:.2f} kW"))
+
+                        # Status labels
+                        self.solar_status_label = ui.label().classes(_MUTED_TEXT_CLASSES)
+                        self.solar_status_label.bind_text_from(
+                            self, 'current_solar_power',
+                            lambda v: _SOLAR_STATUS_UNKNOWN if v is None
+                            else (_SOLAR_STATUS_PRODUCING if v > 0 else _SOLAR_STATUS_IDLE))
+                        self.solar_error_label = ui.label().classes(_ERROR_TEXT_CLASSES)
+                        self.solar_error_label.bind_text_from(
+                            self, 'solar_error',
+                            lambda v: f"{_WARN_PREFIX} {v}" if v else "")
+                        self.solar_error_label.bind_visibility_from(
+                            self, 'solar_error', lambda v: bool(v))
+                        self.solar_updated_label = ui.label().classes(_MUTED_TEXT_CLASSES)
+                        self.solar_updated_label.bind_text_from(
+                            self, 'solar_last_updated',
+                            lambda v: f"Last updated: {v}" if v else "")
+                        self.solar_updated_label.bind_visibility_from(
+                            self, 'solar_last_updated', lambda v: bool(v))
             
             # Version footer
-            version = self._read_version()
-            ui.label(f'v{version}').classes('text-xs text-gray-400 mt-8')
-        
-        # Initial UI update
-        self.update_price_ui()
+            ui.label(f'v{_VERSION}').classes('text-xs text-gray-400 mt-8')
+
+        # Price and solar labels pick up current state through their
+        # bindings; only the refreshable power section needs a first push
         self.update_power_ui()
-        self.update_solar_ui()
-        
-        # Start background updates using timers
-        self.start_background_updates()
-    
-    def _read_version(self) -> str:
-        """Read version from version.txt file"""
-        try:
-            from pathlib import Path
-            import os
-            # Try multiple possible locations for version.txt
-            possible_paths = [
-                Path(__file__).parent.parent.parent / 'version.txt',  # Relative to this file
-                Path('/app/version.txt'),  # Docker container location
-                Path(os.getcwd()) / 'version.txt',  # Current working directory
-            ]
-            
-            for version_file in possible_paths:
-                if version_file.exists():
-                    version = version_file.read_text().strip()
-                    return version
-        except Exception as e:
-            print(f"Could not read version: {e}")
-        return "unknown"
 
 
 # ============================================================================
@@ -482,6 +611,10 @@ except Exception as e:
 # regardless of whether any web clients are connected
 dashboard = SpotPriceDashboard(data_manager=data_manager)
 
+# Start the shared background tasks once, on the server's event loop -
+# page builds only bind UI to the shared state
+app.on_startup(dashboard.start_background_updates)
+
 @ui.page('/')
 async def index():
     """Main page with client tracking"""
@@ -498,6 +631,16 @@ async def index():
     app.on_disconnect(on_disconnect)
 
 if __name__ in {"__main__", "__mp_main__"}:
+    # Use uvloop's C event loop when available - every socket read/write,
+    # timer tick and WebSocket diff goes through the loop, so this is a
+    # flat speedup for the whole app
+    try:
+        import uvloop
+        uvloop.install()
+        print("Running on uvloop")
+    except ImportError:
+        print("uvloop not available, using default asyncio event loop")
+
     # Run the NiceGUI app
     ui.run(
         title='Sotehus',
@@ -22,34 +22,46 @@ Environment variables required:
 
 import sys
 import os
-import argparse
-from datetime import datetime
+import time
 from pathlib import Path
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv
+# Heavier imports (argparse, dotenv, influxdb_client and its urllib3/rx
+# stack) are deferred into the functions that need them, so --help and
+# argument errors return without paying the full import cost
 
-# Load environment variables
-load_dotenv()
+# Cached database-scope results keyed by bucket: first() and count() scan
+# the entire bucket, so watch-mode refreshes reuse the previous answer for
+# a few minutes instead of rescanning on every tick. (A server-side task
+# materializing these would be the full solution, but provisioning tasks
+# is beyond a read-only CLI.)
+_scope_cache = {}
+_SCOPE_TTL_SECONDS = 300.0
 
 
-def list_influx_records(count: int = 50) -> None:
+def connect_influx():
     """
-    Query and display the last N records from InfluxDB
-    
-    Args:
-        count: Number of records to retrieve (default: 50)
+    Read configuration from the environment and open an InfluxDB client
+
+    Returns:
+        Tuple of (client, org, bucket). The client owns a keep-alive
+        connection pool, so callers that issue repeated queries (--watch)
+        should create it once and reuse it.
     """
+    # Load environment variables (deferred along with the client import)
+    from dotenv import load_dotenv
+    load_dotenv()
+
     try:
         from influxdb_client import InfluxDBClient
     except ImportError:
         print("Error: influxdb-client not installed")
         print("Install it with: pip install influxdb-client")
         sys.exit(1)
-    
+
     # Get configuration from environment
     host = os.getenv('INFLUXDB2_HOST', 'localhost')
     port = os.getenv('INFLUXDB2_PORT', '8086')
@@ -58,158 +70,297 @@ def list_influx_records(count: int = 50) -> None:
     token = os.getenv('INFLUXDB2_TOKEN')
     org = os.getenv('INFLUXDB2_ORG', 'sotehus')
     bucket = os.getenv('INFLUXDB2_BUCKET', 'sotehus_bucket')
-    
+
     # Validate required configuration
     if not host:
         print("Error: INFLUXDB2_HOST not set in environment")
         sys.exit(1)
-    
+
     if not token and not (user and password):
         print("Error: Either INFLUXDB2_TOKEN or both INFLUXDB2_USER and INFLUXDB2_PASSWORD must be set")
         sys.exit(1)
-    
+
     # Build connection URL
     url = f"http://{host}:{port}"
-    
+
     print(f"Connecting to InfluxDB at {url}...")
     print(f"Organization: {org}")
     print(f"Bucket: {bucket}")
-    print(f"Retrieving last {count} records...\n")
-    
-    # Create client
+
+    # Create client. Annotated CSV is highly repetitive, so gzip cuts the
+    # bytes on the wire severalfold for large result sets.
     try:
         if token:
-            client = InfluxDBClient(url=url, token=token, org=org)
+            client = InfluxDBClient(url=url, token=token, org=org, enable_gzip=True)
         else:
             client = InfluxDBClient(
                 url=url,
                 username=user,
                 password=password,
-                org=org
+                org=org,
+                enable_gzip=True
             )
-        
+
         # Test connection
         health = client.health()
         if health.status != "pass":
             print(f"Error: InfluxDB health check failed: {health.message}")
             sys.exit(1)
-        
+
         print("✓ Connected to InfluxDB successfully\n")
-        
+
     except Exception as e:
         print(f"Error connecting to InfluxDB: {e}")
         sys.exit(1)
-    
+
+    return client, org, bucket
+
+
+def list_influx_records(count: int = 50, client=None, org: str = None, bucket: str = None,
+                        output: str = None) -> None:
+    """
+    Query and display the last N records from InfluxDB
+
+    Args:
+        count: Number of records to retrieve (default: 50)
+        client: An already-connected InfluxDBClient to reuse (optional);
+            when omitted a client is created and closed per call
+        org: Organization for the reused client
+        bucket: Bucket for the reused client
+        output: Path of a CSV file to stream records into instead of
+            printing the table; memory stays constant regardless of count
+    """
+    from datetime import datetime, timedelta
+
+    # Reusing the caller's client skips the TCP handshake and health check
+    # on every refresh in watch mode
+    own_client = client is None
+    if own_client:
+        client, org, bucket = connect_influx()
+
+    print(f"Retrieving last {count} records...\n")
+
     # Query last N records
     query_api = client.query_api()
     
-    query = f'''
-    from(bucket: "{bucket}")
-        |> range(start: -30d)
+    # Filter down to the known fields and take the tail before pivoting:
+    # range/filter/tail all push down into the storage engine, so the
+    # server reads only the newest blocks instead of scanning a wide
+    # window through the Flux VM (pivot and sort block pushdown, so they
+    # must come last). The trailing sort only reorders the final pivoted
+    # rows for newest-first display.
+    #
+    # bucket, count and range start are passed as Flux params rather than
+    # interpolated: the query text stays identical across invocations, so
+    # the server can reuse its cached plan, and the values never touch
+    # the script source
+    query = '''
+    from(bucket: _bucket)
+        |> range(start: _start)
         |> filter(fn: (r) => r._measurement == "power_monitoring")
+        |> filter(fn: (r) => r._field == "grid_power" or r._field == "spot_price" or r._field == "solar_production")
+        |> tail(n: _count)
         |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
         |> sort(columns: ["_time"], desc: true)
-        |> limit(n: {count})
     '''
     
+    # Size the range window to what can plausibly hold `count` records:
+    # samples land roughly once a minute or faster, so count minutes with
+    # 4x slack (min one hour) covers gaps while letting the storage engine
+    # skip almost all of the default 30-day window. If the narrow window
+    # comes back short, retry once at the full window - nothing has been
+    # printed yet at that point, because narrow attempts buffer their rows.
+    max_window_seconds = 30 * 86400
+    window_seconds = min(max_window_seconds, max(3600, count * 60 * 4))
+    attempt_windows = [window_seconds]
+    if window_seconds < max_window_seconds:
+        attempt_windows.append(max_window_seconds)
+
+    csv_file = None
+
     try:
-        tables = query_api.query(query, org=org)
-        
-        if not tables:
-            print("No records found in the database.")
-            print("\nTip: Make sure data is being written to InfluxDB.")
-            client.close()
-            return
-        
-        # Count total records
-        record_count = 0
-        for table in tables:
-            record_count += len(table.records)
-        
+        for window in attempt_windows:
+            final_attempt = window == attempt_windows[-1]
+
+            # Stream records instead of materializing every FluxTable: rows
+            # are printed as they arrive off the wire and the summary
+            # statistics are accumulated in the same pass, so peak memory
+            # stays O(1) per row and the first row appears at first-chunk
+            # latency
+            records = query_api.query_stream(query, org=org, params={
+                "_bucket": bucket,
+                "_count": count,
+                "_start": timedelta(seconds=-window),
+            })
+
+            record_count = 0
+            last_time = None
+
+            # Buffer formatted rows and emit them in batches: one write() per
+            # thousand rows instead of one syscall per record, which is the
+            # difference between syscall-bound and memcpy-bound output when
+            # large listings are piped or redirected
+            out_lines = []
+
+            # CSV export streams rows straight to disk - nothing but the
+            # stats scalars is retained, so --count can be arbitrarily
+            # large. Opened with truncation per attempt so a widened retry
+            # restarts the file instead of appending duplicates.
+            csv_writer = None
+            if output:
+                import csv
+                if csv_file is not None:
+                    csv_file.close()
+                csv_file = open(output, 'w', newline='')
+                csv_writer = csv.writer(csv_file)
+                csv_writer.writerow(['time', 'grid_power', 'spot_price', 'solar_production'])
+
+            # Single-pass accumulators for the summary statistics
+            grid_sum = grid_min = grid_max = 0.0
+            grid_n = 0
+            spot_sum = spot_min = spot_max = 0.0
+            spot_n = 0
+            solar_sum = solar_min = solar_max = 0.0
+            solar_n = 0
+
+            # Hoist loop-invariant lookups: bound methods and the timestamp
+            # format resolve once instead of per row
+            append = out_lines.append
+            write = sys.stdout.write
+            ts_fmt = '%Y-%m-%d %H:%M:%S'
+
+            # Display records (sorted by time descending server-side)
+            for record in records:
+                if record_count == 0 and csv_writer is None:
+                    append(f"{'Timestamp (UTC)':<28} {'Grid Power (W)':<15} {'Spot Price (SEK/kWh)':<23} {'Solar Production (W)':<20}")
+                    append("=" * 110)
+                record_count += 1
+
+                # One values binding per record instead of four attribute
+                # resolutions, and get_time() short-circuits the _time lookup
+                rec = record.values
+                timestamp = record.get_time()
+                grid_power = rec.get('grid_power')
+                spot_price = rec.get('spot_price')
+                solar_production = rec.get('solar_production')
+
+                # The first streamed row is the newest; remember it for the scope section
+                if last_time is None:
+                    last_time = timestamp
+
+                if csv_writer is not None:
+                    ts_out = timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp
+                    csv_writer.writerow([ts_out, grid_power, spot_price, solar_production])
+                else:
+                    # Format timestamp
+                    if timestamp:
+                        if isinstance(timestamp, datetime):
+                            ts_str = timestamp.strftime(ts_fmt)
+                        else:
+                            ts_str = str(timestamp)
+                    else:
+                        ts_str = "N/A"
+
+                    # Format values with proper handling of None
+                    grid_str = f"{grid_power:>12.1f}" if grid_power is not None else "         N/A"
+                    spot_str = f"{spot_price:>20.4f}" if spot_price is not None else "                  N/A"
+                    solar_str = f"{solar_production:>17.1f}" if solar_production is not None else "                 N/A"
+
+                    append(f"{ts_str:<28} {grid_str:<15} {spot_str:<23} {solar_str:<20}")
+                    # Flush periodically so memory stays bounded on huge
+                    # listings - but only once the window is final, so an
+                    # undershooting narrow attempt can be retried silently
+                    if final_attempt and len(out_lines) >= 1000:
+                        write("\n".join(out_lines) + "\n")
+                        out_lines.clear()
+
+                # Update the running statistics in the same pass
+                if grid_power is not None:
+                    grid_n += 1
+                    grid_sum += grid_power
+                    if grid_n == 1 or grid_power < grid_min:
+                        grid_min = grid_power
+                    if grid_n == 1 or grid_power > grid_max:
+                        grid_max = grid_power
+                if spot_price is not None:
+                    spot_n += 1
+                    spot_sum += spot_price
+                    if spot_n == 1 or spot_price < spot_min:
+                        spot_min = spot_price
+                    if spot_n == 1 or spot_price > spot_max:
+                        spot_max = spot_price
+                if solar_production is not None:
+                    solar_n += 1
+                    solar_sum += solar_production
+                    if solar_n == 1 or solar_production < solar_min:
+                        solar_min = solar_production
+                    if solar_n == 1 or solar_production > solar_max:
+                        solar_max = solar_production
+
+            if record_count >= count or final_attempt:
+                break
+            # Narrow window came back short - widen and refetch
+
+        if csv_file is not None:
+            csv_file.close()
+            csv_file = None
+
         if record_count == 0:
             print("No records found in the database.")
             print("\nTip: Make sure data is being written to InfluxDB.")
-            client.close()
             return
-        
-        print(f"{'Timestamp (UTC)':<28} {'Grid Power (W)':<15} {'Spot Price (SEK/kWh)':<23} {'Solar Production (W)':<20}")
-        print("=" * 110)
-        
-        # Display records (already sorted by time descending)
-        for table in tables:
-            for record in table.records:
-                timestamp = record.values.get('_time')
-                grid_power = record.values.get('grid_power')
-                spot_price = record.values.get('spot_price')
-                solar_production = record.values.get('solar_production')
-                
-                # Format timestamp
-                if timestamp:
-                    if isinstance(timestamp, datetime):
-                        ts_str = timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                    else:
-                        ts_str = str(timestamp)
-                else:
-                    ts_str = "N/A"
-                
-                # Format values with proper handling of None
-                grid_str = f"{grid_power:>12.1f}" if grid_power is not None else "         N/A"
-                spot_str = f"{spot_price:>20.4f}" if spot_price is not None else "                  N/A"
-                solar_str = f"{solar_production:>17.1f}" if solar_production is not None else "                 N/A"
-                
-                print(f"{ts_str:<28} {grid_str:<15} {spot_str:<23} {solar_str:<20}")
-        
-        print("=" * 110)
+
+        if output:
+            print(f"Wrote {record_count} records to {output}")
+        else:
+            if out_lines:
+                sys.stdout.write("\n".join(out_lines) + "\n")
+            print("=" * 110)
         print(f"\nTotal records displayed: {record_count}")
         
         # Get database scope statistics
         print("\n--- Database Scope ---")
         try:
-            # Query for first record
-            first_query = f'''
-            from(bucket: "{bucket}")
-                |> range(start: 0)
-                |> filter(fn: (r) => r._measurement == "power_monitoring")
-                |> sort(columns: ["_time"])
-                |> limit(n: 1)
-            '''
-            first_result = query_api.query(first_query, org=org)
-            
-            # Query for total count
-            count_query = f'''
-            from(bucket: "{bucket}")
-                |> range(start: 0)
-                |> filter(fn: (r) => r._measurement == "power_monitoring")
-                |> filter(fn: (r) => r._field == "grid_power")
-                |> count()
-            '''
-            count_result = query_api.query(count_query, org=org)
-            
-            first_time = None
-            last_time = None
-            total_records = 0
-            
-            # Get first timestamp
-            if first_result and len(first_result) > 0:
-                for table in first_result:
-                    if len(table.records) > 0:
-                        first_time = table.records[0].values.get('_time')
-                        break
-            
-            # Get total count
-            if count_result and len(count_result) > 0:
-                for table in count_result:
-                    if len(table.records) > 0:
-                        total_records = table.records[0].values.get('_value', 0)
-                        break
-            
-            # Get last timestamp from displayed records
-            if tables and len(tables) > 0:
-                for table in tables:
-                    if len(table.records) > 0:
-                        last_time = table.records[0].values.get('_time')
-                        break
-            
+            cached_scope = _scope_cache.get(bucket)
+            if cached_scope is not None and time.monotonic() - cached_scope[0] < _SCOPE_TTL_SECONDS:
+                # Reuse the recent full-bucket scan (watch mode refreshes
+                # far more often than these numbers meaningfully change)
+                first_time, total_records = cached_scope[1], cached_scope[2]
+            else:
+                # One combined query instead of two round trips: the earliest
+                # timestamp and the total count are computed server-side and
+                # returned together, tagged via a _stat column for dispatch.
+                # first() and count() on a single field both push down.
+                scope_query = '''
+                src = from(bucket: _bucket)
+                    |> range(start: 0)
+                    |> filter(fn: (r) => r._measurement == "power_monitoring")
+                    |> filter(fn: (r) => r._field == "grid_power")
+                earliest = src
+                    |> first()
+                    |> set(key: "_stat", value: "first")
+                total = src
+                    |> count()
+                    |> set(key: "_stat", value: "count")
+                union(tables: [earliest, total])
+                '''
+                scope_result = query_api.query(scope_query, org=org, params={"_bucket": bucket})
+
+                first_time = None
+                total_records = 0
+
+                # Dispatch the combined result on the _stat tag
+                for table in scope_result:
+                    for record in table.records:
+                        stat = record.values.get('_stat')
+                        if stat == 'first':
+                            first_time = record.values.get('_time')
+                        elif stat == 'count':
+                            total_records = record.values.get('_value', 0)
+
+                _scope_cache[bucket] = (time.monotonic(), first_time, total_records)
+
+            # last_time was captured from the first (newest) streamed record
             if first_time and last_time:
                 duration = last_time - first_time
                 days = duration.total_seconds() / 86400
@@ -223,32 +374,19 @@ def list_influx_records(count: int = 50) -> None:
         except Exception as e:
             print(f"Could not retrieve database scope: {e}")
         
-        # Show summary statistics
+        # Show summary statistics, computed during the display pass
         print("\n--- Summary Statistics (Displayed Records) ---")
-        all_grid_power = []
-        all_spot_price = []
-        all_solar_production = []
-        
-        for table in tables:
-            for record in table.records:
-                if record.values.get('grid_power') is not None:
-                    all_grid_power.append(record.values['grid_power'])
-                if record.values.get('spot_price') is not None:
-                    all_spot_price.append(record.values['spot_price'])
-                if record.values.get('solar_production') is not None:
-                    all_solar_production.append(record.values['solar_production'])
-        
-        if all_grid_power:
-            print(f"Grid Power:        avg={sum(all_grid_power)/len(all_grid_power):>8.1f} W, "
-                  f"min={min(all_grid_power):>8.1f} W, max={max(all_grid_power):>8.1f} W")
-        
-        if all_spot_price:
-            print(f"Spot Price:        avg={sum(all_spot_price)/len(all_spot_price):>8.4f} SEK/kWh, "
-                  f"min={min(all_spot_price):>8.4f} SEK/kWh, max={max(all_spot_price):>8.4f} SEK/kWh")
-        
-        if all_solar_production:
-            print(f"Solar Production:  avg={sum(all_solar_production)/len(all_solar_production):>8.1f} W, "
-                  f"min={min(all_solar_production):>8.1f} W, max={max(all_solar_production):>8.1f} W")
+        if grid_n:
+            print(f"Grid Power:        avg={grid_sum / grid_n:>8.1f} W, "
+                  f"min={grid_min:>8.1f} W, max={grid_max:>8.1f} W")
+
+        if spot_n:
+            print(f"Spot Price:        avg={spot_sum / spot_n:>8.4f} SEK/kWh, "
+                  f"min={spot_min:>8.4f} SEK/kWh, max={spot_max:>8.4f} SEK/kWh")
+
+        if solar_n:
+            print(f"Solar Production:  avg={solar_sum / solar_n:>8.1f} W, "
+                  f"min={solar_min:>8.1f} W, max={solar_max:>8.1f} W")
         
     except Exception as e:
         print(f"Error querying InfluxDB: {e}")
@@ -257,11 +395,16 @@ def list_influx_records(count: int = 50) -> None:
         sys.exit(1)
     
     finally:
-        client.close()
+        if csv_file is not None:
+            csv_file.close()
+        if own_client:
+            client.close()
 
 
 def main():
     """Main entry point"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='List the last N records from InfluxDB power_monitoring measurement',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -293,14 +436,46 @@ Environment variables:
         default=50,
         help='Number of records to retrieve (default: 50)'
     )
-    
+
+    parser.add_argument(
+        '-w', '--watch',
+        type=float,
+        metavar='SECONDS',
+        help='Refresh the listing every SECONDS, reusing one connection'
+    )
+
+    parser.add_argument(
+        '-o', '--output',
+        metavar='FILE',
+        help='Stream records to FILE as CSV instead of printing the table'
+    )
+
     args = parser.parse_args()
-    
+
     if args.count < 1:
         print("Error: count must be a positive number")
         sys.exit(1)
-    
-    list_influx_records(args.count)
+
+    if args.watch is not None and args.watch <= 0:
+        print("Error: watch interval must be a positive number of seconds")
+        sys.exit(1)
+
+    if args.watch is None:
+        list_influx_records(args.count, output=args.output)
+        return
+
+    # Watch mode: one client for the whole session, so every refresh after
+    # the first reuses the established connection instead of paying a new
+    # TCP handshake and health check
+    client, org, bucket = connect_influx()
+    try:
+        while True:
+            list_influx_records(args.count, client=client, org=org, bucket=bucket, output=args.output)
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        client.close()
 
 
 if __name__ == '__main__':